@@ -205,7 +205,7 @@ def extract_candidate_pixels(
     width = ds.RasterXSize
     height = ds.RasterYSize
 
-    rng = np.random.RandomState(seed)
+    rng = np.random.default_rng(seed)
     coords = []
 
     for y_off in range(0, height, block_size):
@@ -8,13 +8,15 @@ Depends on: core.*, domain.*.
 
 from typing import Callable, Dict, List, Optional
 
+import numpy as np
+
 from ..domain.models import SampleDesign, SampleSet
 from ..domain.sample_size import (
     allocate_equal,
     allocate_proportional,
     calculate_sample_size,
 )
-from ..domain.sampling import generate_stratified_random
+from ..domain.sampling import RNG_SCHEME, generate_stratified_random
 from .raster_reader import count_pixels_per_class, extract_candidate_pixels
 
 
@@ -103,7 +105,7 @@ def run_sample_generation(
             progress_callback(i + 1, total_steps * 2)  # first half: extraction
 
     # Step 5: Generate stratified random points
-    points, gen_warnings = generate_stratified_random(
+    points, coords, gen_warnings = generate_stratified_random(
         candidates_per_class=candidates_per_class,
         n_per_class=n_per_class,
         min_distance=min_distance_m,
@@ -112,13 +114,15 @@ def run_sample_generation(
             lambda step, total: progress_callback(total_steps + step, total_steps * 2)
             if progress_callback else None
         ),
+        return_arrays=True,
     )
     all_warnings.extend(gen_warnings)
 
     # Step 6: Build strata info
     strata_info = {}
+    strata = np.array([p.stratum_class for p in points], dtype=np.int64)
     for cls in class_labels:
-        n_gen = sum(1 for p in points if p.stratum_class == cls)
+        n_gen = int(np.count_nonzero(strata == cls))
         strata_info[cls] = {
             "name": class_names.get(cls, str(cls)) if class_names else str(cls),
             "pixel_count": pixel_counts[cls],
@@ -136,11 +140,15 @@ def run_sample_generation(
         expected_accuracy=expected_accuracy,
         margin_of_error=margin_of_error,
         random_seed=seed,
+        rng_scheme=RNG_SCHEME,
     )
 
     return SampleSet(
         design=design,
-        points=tuple(points),
+        ids=np.array([p.id for p in points], dtype=np.int64),
+        xs=coords[:, 0].copy(),
+        ys=coords[:, 1].copy(),
+        strata=strata,
         strata_info=strata_info,
         warnings=tuple(all_warnings),
     )
@@ -93,6 +93,7 @@ def export_sample_points(
     epsg: int,
     class_names: Optional[Dict[int, str]] = None,
     driver_name: str = "GPKG",
+    metadata: Optional[Dict[str, str]] = None,
 ) -> str:
     """Export sample points to a vector file.
 
@@ -102,6 +103,8 @@ def export_sample_points(
         epsg: CRS EPSG code.
         class_names: Optional {class_value: name} for the stratum_name field.
         driver_name: OGR driver name ("GPKG" or "ESRI Shapefile").
+        metadata: Optional layer metadata items (e.g. seed and RNG
+            scheme). Kept by GeoPackage; Shapefile has no layer metadata.
 
     Returns:
         Output file path.
@@ -118,6 +121,8 @@ def export_sample_points(
     srs.ImportFromEPSG(epsg)
 
     layer = ds.CreateLayer("samples", srs, ogr.wkbPoint)
+    for key, value in (metadata or {}).items():
+        layer.SetMetadataItem(key, value)
 
     # Define fields
     layer.CreateField(ogr.FieldDefn("point_id", ogr.OFTInteger))
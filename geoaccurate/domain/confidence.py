@@ -1,33 +1,47 @@
 """Confidence interval methods for GeoAccuRate.
 
 Implements Wilson score intervals for proportions.
-No QGIS or Qt imports. Only depends on: math.
+No QGIS or Qt imports. Only depends on: math, functools, numpy.
 """
 
+import functools
 import math
 from typing import Tuple
 
+import numpy as np
+
 # z-scores for common confidence levels
 Z_SCORES = {
     0.80: 1.2816,
     0.85: 1.4395,
     0.90: 1.6449,
     0.95: 1.9600,
+    0.975: 2.2414,
     0.99: 2.5758,
+    0.995: 2.8070,
+    0.999: 3.2905,
 }
 
 
+@functools.lru_cache(maxsize=64)
 def z_score_for_confidence(confidence_level: float) -> float:
     """Get z-score for a given confidence level.
 
+    Tabulated levels are matched after rounding to 4 decimals, so values
+    like 0.95000000001 coming from spin boxes still hit the table. This
+    also snaps any level within 5e-5 of a tabulated one to it (0.97501
+    returns the 0.975 z-score). Other levels use the Abramowitz & Stegun
+    approximation. Results are memoized per confidence level.
+
     Args:
         confidence_level: Confidence level in [0, 1], e.g. 0.95.
 
     Returns:
         Corresponding z-score.
     """
-    if confidence_level in Z_SCORES:
-        return Z_SCORES[confidence_level]
+    z = Z_SCORES.get(round(confidence_level, 4))
+    if z is not None:
+        return z
     # Fall back to approximation via inverse normal CDF (Abramowitz & Stegun)
     # For arbitrary confidence levels
     p = (1 + confidence_level) / 2
@@ -51,17 +65,41 @@ def wilson_ci(p: float, n: int, z: float = 1.96) -> Tuple[float, float]:
     Returns:
         (lower, upper) confidence interval bounds.
     """
-    if n == 0:
-        return (0.0, 1.0)
+    lower, upper = wilson_ci_vec(np.array([p]), np.array([n]), z)
+    return (float(lower[0]), float(upper[0]))
 
-    z2 = z * z
-    denom = 1.0 + z2 / n
-    center = (p + z2 / (2.0 * n)) / denom
-    spread = z * math.sqrt((p * (1.0 - p) / n) + (z2 / (4.0 * n * n))) / denom
 
-    lower = max(0.0, center - spread)
-    upper = min(1.0, center + spread)
-    return (lower, upper)
+def wilson_ci_vec(
+    p: np.ndarray, n: np.ndarray, z: float = 1.96,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorized Wilson score interval for many proportions at once.
+
+    wilson_ci() is the scalar wrapper around this function. Entries with
+    n == 0 get the uninformative interval (0, 1).
+
+    Args:
+        p: Observed proportions.
+        n: Sample sizes (same shape as p).
+        z: Z-score for desired confidence level.
+
+    Returns:
+        (lower, upper) arrays of confidence interval bounds.
+    """
+    p = np.asarray(p, dtype=np.float64)
+    n = np.asarray(n, dtype=np.float64)
+    has_n = n > 0
+    n_safe = np.where(has_n, n, 1.0)
+
+    z2 = z * z
+    denom = 1.0 + z2 / n_safe
+    center = (p + z2 / (2.0 * n_safe)) / denom
+    spread = z * np.sqrt(
+        (p * (1.0 - p) / n_safe) + (z2 / (4.0 * n_safe * n_safe))
+    ) / denom
+
+    lower = np.where(has_n, np.maximum(0.0, center - spread), 0.0)
+    upper = np.where(has_n, np.minimum(1.0, center + spread), 1.0)
+    return lower, upper
 
 
 def kappa_ci(kappa: float, p_o: float, p_e: float, n: int,
@@ -6,11 +6,12 @@ This follows Congalton & Green (2019).
 No QGIS or Qt imports. Only depends on: numpy.
 """
 
-from typing import Dict, Tuple
+import functools
+from typing import Dict, Optional, Tuple
 
 import numpy as np
 
-from .confidence import wilson_ci, z_score_for_confidence
+from .confidence import wilson_ci, wilson_ci_vec, z_score_for_confidence
 
 
 def build_matrix(
@@ -39,18 +40,116 @@ def build_matrix(
         raise ValueError("Cannot build confusion matrix from empty arrays")
 
     k = len(class_labels)
+    classified = np.asarray(classified)
+    reference = np.asarray(reference)
+
+    labels = tuple(class_labels)
+    lookup = _label_index_array(labels)
+    if (
+        lookup is not None
+        and np.issubdtype(classified.dtype, np.integer)
+        and np.issubdtype(reference.dtype, np.integer)
+    ):
+        if k <= _MAX_U8_CLASSES:
+            # Small k: every r * k + c fits in one byte, so the index
+            # arrays stay uint8 (1/8 of the memory traffic of intp) and
+            # pairs with an unknown label are sent to the _U8_SKIP bin.
+            lookup_u8 = _label_index_array_u8(labels)
+            r_idx = _lookup_indices(lookup_u8, reference, _U8_SKIP)
+            c_idx = _lookup_indices(lookup_u8, classified, _U8_SKIP)
+            flat = r_idx * np.uint8(k) + c_idx
+            flat[(r_idx == _U8_SKIP) | (c_idx == _U8_SKIP)] = _U8_SKIP
+            counts = np.bincount(flat, minlength=_U8_SKIP + 1)[: k * k]
+            return counts.reshape(k, k).astype(np.int64)
+
+        # Vectorized path: map values to row indices, drop unknown labels,
+        # and count (row, col) pairs in one bincount over r * k + c.
+        r_idx = _lookup_indices(lookup, reference, -1)
+        c_idx = _lookup_indices(lookup, classified, -1)
+        valid = (r_idx >= 0) & (c_idx >= 0)
+        flat = r_idx[valid] * k + c_idx[valid]
+        counts = np.bincount(flat, minlength=k * k)
+        return counts.reshape(k, k).astype(np.int64)
+
+    # Fallback for non-integer or sparse/large labels: map each distinct
+    # value through a dict once, then scatter-add the pairs in C.
     label_to_idx = {label: i for i, label in enumerate(class_labels)}
+    r_idx = _dict_indices(label_to_idx, reference)
+    c_idx = _dict_indices(label_to_idx, classified)
+    valid = (r_idx >= 0) & (c_idx >= 0)
 
     matrix = np.zeros((k, k), dtype=np.int64)
-    for c_val, r_val in zip(classified, reference):
-        r_idx = label_to_idx.get(r_val)
-        c_idx = label_to_idx.get(c_val)
-        if r_idx is not None and c_idx is not None:
-            matrix[r_idx, c_idx] += 1
-
+    np.add.at(matrix, (r_idx[valid], c_idx[valid]), 1)
     return matrix
 
 
+# Largest class value handled by the lookup-table path in build_matrix
+_MAX_LOOKUP_LABEL = 65535
+
+
+@functools.lru_cache(maxsize=64)
+def _label_index_array(class_labels: Tuple[int, ...]) -> Optional[np.ndarray]:
+    """Array mapping class value -> row index (-1 for unknown values).
+
+    Cached per label tuple, since the same labels are passed on every
+    call for a given layer. The returned array is read-only.
+
+    Returns None when labels are empty or not small non-negative
+    integers, in which case callers fall back to a dict lookup.
+    """
+    if not class_labels:
+        return None
+    if not all(isinstance(lbl, (int, np.integer)) for lbl in class_labels):
+        return None
+    if min(class_labels) < 0 or max(class_labels) > _MAX_LOOKUP_LABEL:
+        return None
+
+    lookup = np.full(max(class_labels) + 1, -1, dtype=np.intp)
+    lookup[list(class_labels)] = np.arange(len(class_labels))
+    lookup.setflags(write=False)
+    return lookup
+
+
+# build_matrix keeps uint8 indices when k * k stays below the skip value
+_U8_SKIP = 255
+_MAX_U8_CLASSES = 15
+
+
+@functools.lru_cache(maxsize=64)
+def _label_index_array_u8(class_labels: Tuple[int, ...]) -> np.ndarray:
+    """uint8 variant of _label_index_array, with _U8_SKIP for unknowns."""
+    lookup = _label_index_array(class_labels)
+    lookup_u8 = np.where(lookup >= 0, lookup, _U8_SKIP).astype(np.uint8)
+    lookup_u8.setflags(write=False)
+    return lookup_u8
+
+
+def _lookup_indices(
+    lookup: np.ndarray, values: np.ndarray, missing: int,
+) -> np.ndarray:
+    """Map integer values to row indices, ``missing`` where not a label."""
+    idx = np.full(values.shape, missing, dtype=lookup.dtype)
+    in_range = (values >= 0) & (values < len(lookup))
+    idx[in_range] = lookup[values[in_range]]
+    return idx
+
+
+def _dict_indices(label_to_idx: Dict, values: np.ndarray) -> np.ndarray:
+    """Map arbitrary values to row indices via a dict, -1 for unknowns."""
+    try:
+        uniq, inverse = np.unique(values, return_inverse=True)
+    except TypeError:
+        # Mixed-type object arrays (e.g. int and str) can't be sorted
+        return np.fromiter(
+            (label_to_idx.get(v, -1) for v in values.tolist()),
+            dtype=np.intp, count=values.size,
+        )
+    table = np.array(
+        [label_to_idx.get(u, -1) for u in uniq.tolist()], dtype=np.intp
+    )
+    return table[inverse.ravel()]
+
+
 def compute_metrics(
     matrix: np.ndarray,
     class_labels: Tuple[int, ...],
@@ -77,60 +176,57 @@ def compute_metrics(
             f"{k} class labels"
         )
 
-    N = int(matrix.sum())
+    # One contiguous view in the input dtype (float matrices are not
+    # truncated); all totals are derived from a single row/column
+    # reduction each instead of repeated full-matrix passes.
+    m = np.ascontiguousarray(matrix)
+    row_totals = m.sum(axis=1)    # reference totals
+    col_totals = m.sum(axis=0)    # classified totals
+    diagonal = m.diagonal()
+
+    N = int(row_totals.sum())
     if N == 0:
         raise ValueError("Confusion matrix has zero total samples")
 
     z = z_score_for_confidence(confidence_level)
 
-    row_totals = matrix.sum(axis=1)    # reference totals
-    col_totals = matrix.sum(axis=0)    # classified totals
-    diagonal = matrix.diagonal()
-
     # Overall accuracy
     oa = float(diagonal.sum()) / N
     oa_ci = wilson_ci(oa, N, z)
 
-    pa: Dict[int, float] = {}
-    ua: Dict[int, float] = {}
-    pa_ci: Dict[int, Tuple[float, float]] = {}
-    ua_ci: Dict[int, Tuple[float, float]] = {}
-    f1: Dict[int, float] = {}
-    precision: Dict[int, float] = {}
-    recall: Dict[int, float] = {}
-
-    for i, label in enumerate(class_labels):
-        # Producer's accuracy (recall)
-        if row_totals[i] > 0:
-            pa_val = float(diagonal[i]) / float(row_totals[i])
-            pa[label] = pa_val
-            pa_ci[label] = wilson_ci(pa_val, int(row_totals[i]), z)
-        else:
-            pa[label] = float("nan")
-            pa_ci[label] = (float("nan"), float("nan"))
-
-        # User's accuracy (precision)
-        if col_totals[i] > 0:
-            ua_val = float(diagonal[i]) / float(col_totals[i])
-            ua[label] = ua_val
-            ua_ci[label] = wilson_ci(ua_val, int(col_totals[i]), z)
-        else:
-            ua[label] = float("nan")
-            ua_ci[label] = (float("nan"), float("nan"))
-
-        # F1 score
-        pa_v = pa[label]
-        ua_v = ua[label]
-        if (
-            not (np.isnan(pa_v) or np.isnan(ua_v))
-            and (pa_v + ua_v) > 0
-        ):
-            f1[label] = 2.0 * pa_v * ua_v / (pa_v + ua_v)
-        else:
-            f1[label] = float("nan")
-
-        precision[label] = ua[label]  # precision = user's accuracy
-        recall[label] = pa[label]     # recall = producer's accuracy
+    # Per-class PA/UA and their Wilson CIs, vectorized over classes
+    # (NaN where a class has no reference/classified samples)
+    diag_f = diagonal.astype(np.float64)
+    has_row = row_totals > 0
+    has_col = col_totals > 0
+    with np.errstate(invalid="ignore", divide="ignore"):
+        pa_arr = np.divide(diag_f, row_totals, out=np.full(k, np.nan),
+                           where=has_row)
+        ua_arr = np.divide(diag_f, col_totals, out=np.full(k, np.nan),
+                           where=has_col)
+    pa_lo, pa_hi = wilson_ci_vec(np.nan_to_num(pa_arr), row_totals, z)
+    ua_lo, ua_hi = wilson_ci_vec(np.nan_to_num(ua_arr), col_totals, z)
+    # Classes without samples get an undefined (NaN) interval
+    pa_lo[~has_row] = pa_hi[~has_row] = np.nan
+    ua_lo[~has_col] = ua_hi[~has_col] = np.nan
+
+    # F1 score: harmonic mean of PA and UA (NaN if either is undefined)
+    pa_ua = pa_arr + ua_arr
+    f1_ok = pa_ua > 0    # False for NaN
+    f1_arr = np.full(k, np.nan)
+    f1_arr[f1_ok] = 2.0 * pa_arr[f1_ok] * ua_arr[f1_ok] / pa_ua[f1_ok]
+
+    pa: Dict[int, float] = dict(zip(class_labels, pa_arr.tolist()))
+    ua: Dict[int, float] = dict(zip(class_labels, ua_arr.tolist()))
+    pa_ci: Dict[int, Tuple[float, float]] = dict(
+        zip(class_labels, zip(pa_lo.tolist(), pa_hi.tolist()))
+    )
+    ua_ci: Dict[int, Tuple[float, float]] = dict(
+        zip(class_labels, zip(ua_lo.tolist(), ua_hi.tolist()))
+    )
+    f1: Dict[int, float] = dict(zip(class_labels, f1_arr.tolist()))
+    precision: Dict[int, float] = dict(ua)  # precision = user's accuracy
+    recall: Dict[int, float] = dict(pa)     # recall = producer's accuracy
 
     return {
         "overall_accuracy": oa,
@@ -158,6 +254,10 @@ def normalize_confusion_matrix(matrix: np.ndarray, axis: int = 1) -> np.ndarray:
         Zero-sum rows/columns produce all zeros (no NaN/Inf).
     """
     m = matrix.astype(np.float64)
+    # Zero-sum rows/columns are skipped by where= and keep the zero fill
     totals = m.sum(axis=axis, keepdims=True)
-    safe_totals = np.where(totals == 0, 1.0, totals)
-    return np.where(totals == 0, 0.0, m / safe_totals * 100.0)
+    out = np.zeros(m.shape, dtype=np.float64)
+    np.divide(m, totals, out=out, where=totals > 0)
+    out *= 100.0
+    return out
+
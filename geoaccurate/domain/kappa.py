@@ -14,6 +14,9 @@ import numpy as np
 
 from .confidence import kappa_ci as _kappa_ci
 
+# 1 - p_e below this is treated as p_e == 1 (Kappa undefined)
+_DEGENERATE_EPS = 1e-12
+
 
 def compute(matrix: np.ndarray) -> Tuple[float, Tuple[float, float]]:
     """Compute Cohen's Kappa and its confidence interval.
@@ -38,12 +41,12 @@ def compute(matrix: np.ndarray) -> Tuple[float, Tuple[float, float]]:
     p_o = diagonal.sum() / N
     p_e = float((row_totals * col_totals).sum()) / (N * N)
 
-    if abs(1.0 - p_e) < 1e-15:
-        # Degenerate case: expected agreement = 1
-        # Kappa is undefined; return 0 by convention
+    # Degenerate case: expected agreement = 1 (e.g. a single class).
+    # Kappa is undefined; return 0 with a zero-width CI by convention.
+    # The tolerance also absorbs rounding that leaves p_e a hair off 1.
+    denom = 1.0 - p_e
+    if denom < _DEGENERATE_EPS:
         return (0.0, (0.0, 0.0))
 
-    kappa = (p_o - p_e) / (1.0 - p_e)
-    ci = _kappa_ci(kappa, p_o, p_e, N)
-
-    return (float(kappa), ci)
+    kappa = float((p_o - p_e) / denom)
+    return (kappa, _kappa_ci(kappa, float(p_o), p_e, N))
@@ -2,11 +2,12 @@
 
 All models are frozen dataclasses (immutable once created).
 This module has ZERO imports from qgis.* or PyQt5.*.
-Only depends on: numpy, typing, dataclasses.
+Only depends on: numpy, typing, dataclasses, functools.
 """
 
+import functools
 from dataclasses import dataclass
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Optional, Sequence, Tuple
 
 import numpy as np
 
@@ -27,6 +28,7 @@ class SampleDesign:
     expected_accuracy: float          # e.g. 0.85
     margin_of_error: float            # e.g. 0.05
     random_seed: int
+    rng_scheme: str                   # sampling.RNG_SCHEME used with the seed
 
 
 @dataclass(frozen=True)
@@ -38,14 +40,67 @@ class SamplePoint:
     stratum_class: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class SampleSet:
-    """Result of a sample generation run."""
+    """Result of a sample generation run.
+
+    Points are stored as parallel arrays so downstream code (export,
+    distance checks, per-stratum counts) can use vectorized NumPy.
+    ``points`` builds SamplePoint objects on first access for code that
+    works point by point.
+
+    The arrays are made read-only on construction (writable inputs are
+    copied first) so the cached ``points`` cannot go stale. Equality and
+    hashing are by identity, since ndarray fields don't support ``==``.
+    """
     design: SampleDesign
-    points: Tuple[SamplePoint, ...]
+    ids: np.ndarray                   # (n,) int64 point IDs
+    xs: np.ndarray                    # (n,) float64 x coordinates
+    ys: np.ndarray                    # (n,) float64 y coordinates
+    strata: np.ndarray                # (n,) int64 stratum class per point
     strata_info: Dict[int, dict]      # class -> {name, pixel_count, n_generated}
     warnings: Tuple[str, ...]         # e.g. "Only 18/25 for Water"
 
+    def __post_init__(self) -> None:
+        for name in ("ids", "xs", "ys", "strata"):
+            arr = np.asarray(getattr(self, name))
+            if arr.flags.writeable:
+                arr = arr.copy()
+                arr.setflags(write=False)
+            object.__setattr__(self, name, arr)
+
+    def __len__(self) -> int:
+        return int(self.xs.size)
+
+    @functools.cached_property
+    def points(self) -> Tuple[SamplePoint, ...]:
+        return tuple(
+            SamplePoint(id=i, x=x, y=y, stratum_class=s)
+            for i, x, y, s in zip(
+                self.ids.tolist(), self.xs.tolist(),
+                self.ys.tolist(), self.strata.tolist(),
+            )
+        )
+
+    @classmethod
+    def from_points(
+        cls,
+        design: SampleDesign,
+        points: Sequence[SamplePoint],
+        strata_info: Dict[int, dict],
+        warnings: Tuple[str, ...],
+    ) -> "SampleSet":
+        """Build a SampleSet from a sequence of SamplePoint objects."""
+        return cls(
+            design=design,
+            ids=np.array([p.id for p in points], dtype=np.int64),
+            xs=np.array([p.x for p in points], dtype=np.float64),
+            ys=np.array([p.y for p in points], dtype=np.float64),
+            strata=np.array([p.stratum_class for p in points], dtype=np.int64),
+            strata_info=strata_info,
+            warnings=warnings,
+        )
+
 
 # ---------------------------------------------------------------------------
 # Area-weighted accuracy (Olofsson et al. 2014)
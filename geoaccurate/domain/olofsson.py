@@ -55,71 +55,27 @@ def compute(
 
     # Area weights: W_j = mapped area of class j / total area
     W = {label: mapped_area_ha[label] / A_total for label in class_labels}
+    w_arr = np.array([W[label] for label in class_labels], dtype=np.float64)
 
-    # Sample counts per mapped class (column totals)
-    n_j = matrix.sum(axis=0).astype(float)
-
-    # -- Estimated area proportions --
-    # p_hat[i,j] = W[j] * (n_ij / n_j)
-    # Classes with 0 samples in the classified map contribute 0 to all
-    # estimates (their proportions cannot be estimated from the data).
-    p_hat = np.zeros((k, k), dtype=float)
-    for i in range(k):
-        for j in range(k):
-            if n_j[j] > 0:
-                p_hat[i, j] = W[class_labels[j]] * (matrix[i, j] / n_j[j])
+    (a_hat, a_lo, a_hi, oa_w, oa_lo, oa_hi, ua_w, pa_w) = _compute_kernel(
+        np.ascontiguousarray(matrix, dtype=np.float64),
+        w_arr,
+        float(A_total),
+        float(z),
+    )
 
-    # -- Estimated area per reference class --
     A_hat = {}
-    for i, label in enumerate(class_labels):
-        A_hat[label] = float(A_total * p_hat[i, :].sum())
-
-    # -- Overall accuracy (area-weighted) --
-    OA_w = float(sum(p_hat[i, i] for i in range(k)))
-
-    # -- User's accuracy (area-weighted) --
+    A_hat_ci = {}
     UA_w = {}
-    for j, label in enumerate(class_labels):
-        col_sum = float(p_hat[:, j].sum())
-        if col_sum > 0:
-            UA_w[label] = float(p_hat[j, j] / col_sum)
-        else:
-            UA_w[label] = float("nan")
-
-    # -- Producer's accuracy (area-weighted) --
     PA_w = {}
     for i, label in enumerate(class_labels):
-        row_sum = float(p_hat[i, :].sum())
-        if row_sum > 0:
-            PA_w[label] = float(p_hat[i, i] / row_sum)
-        else:
-            PA_w[label] = float("nan")
-
-    # -- Variance and CI for estimated area --
-    A_hat_ci = {}
-    for i, label_i in enumerate(class_labels):
-        var_sum = 0.0
-        for j, label_j in enumerate(class_labels):
-            if n_j[j] > 1:
-                p_ij = matrix[i, j] / n_j[j]
-                w_j = W[label_j]
-                var_sum += w_j ** 2 * p_ij * (1.0 - p_ij) / (n_j[j] - 1)
-        se = A_total * np.sqrt(var_sum)
-        A_hat_ci[label_i] = (
-            float(A_hat[label_i] - z * se),
-            float(A_hat[label_i] + z * se),
-        )
+        A_hat[label] = float(a_hat[i])
+        A_hat_ci[label] = (float(a_lo[i]), float(a_hi[i]))
+        UA_w[label] = float(ua_w[i])
+        PA_w[label] = float(pa_w[i])
 
-    # -- Variance and CI for overall accuracy --
-    var_oa = 0.0
-    for j, label in enumerate(class_labels):
-        if n_j[j] > 1:
-            w_j = W[label]
-            ua_j = UA_w[label]
-            if not np.isnan(ua_j):
-                var_oa += w_j ** 2 * ua_j * (1.0 - ua_j) / (n_j[j] - 1)
-    se_oa = np.sqrt(var_oa)
-    OA_w_ci = (float(OA_w - z * se_oa), float(OA_w + z * se_oa))
+    OA_w = float(oa_w)
+    OA_w_ci = (float(oa_lo), float(oa_hi))
 
     return AreaWeightedResult(
         weight_per_class=dict(W),
@@ -131,3 +87,61 @@ def compute(
         users_accuracy_weighted=UA_w,
         mapped_area_ha=dict(mapped_area_ha),
     )
+
+
+def _compute_kernel(matrix, W, A_total, z):
+    """Numeric core of compute(), on plain arrays.
+
+    Args:
+        matrix: k x k float64 confusion matrix.
+        W: Area weight per class (float64, length k).
+        A_total: Total mapped area.
+        z: Z-score for confidence intervals.
+
+    Returns:
+        (A_hat, A_lo, A_hi, OA_w, OA_lo, OA_hi, UA_w, PA_w) where the
+        per-class values are float64 arrays in class_labels order.
+    """
+    # Sample counts per mapped class (column totals)
+    n_j = matrix.sum(axis=0)
+    n_safe = np.where(n_j > 0, n_j, 1.0)
+
+    # -- Estimated area proportions --
+    # p_hat[i,j] = W[j] * (n_ij / n_j)
+    # Classes with 0 samples in the classified map have an all-zero
+    # column, so they contribute 0 to all estimates.
+    p_ij = matrix / n_safe
+    p_hat = W * p_ij
+    diag = np.diag(p_hat)
+    row_sum = p_hat.sum(axis=1)
+    col_sum = p_hat.sum(axis=0)
+
+    # -- Estimated area per reference class --
+    A_hat = A_total * row_sum
+
+    # -- Overall accuracy (area-weighted) --
+    OA_w = np.trace(p_hat)
+
+    # -- User's / producer's accuracy (area-weighted) --
+    UA_w = np.where(col_sum > 0, diag / np.where(col_sum > 0, col_sum, 1.0),
+                    np.nan)
+    PA_w = np.where(row_sum > 0, diag / np.where(row_sum > 0, row_sum, 1.0),
+                    np.nan)
+
+    # -- Variance and CI for estimated area --
+    # Only mapped classes with more than one sample contribute.
+    has_var = n_j > 1
+    dof = np.where(has_var, n_j - 1.0, 1.0)
+    w2 = W ** 2
+    var_terms = np.where(has_var, w2 * p_ij * (1.0 - p_ij) / dof, 0.0)
+    se = A_total * np.sqrt(var_terms.sum(axis=1))
+    A_lo = A_hat - z * se
+    A_hi = A_hat + z * se
+
+    # -- Variance and CI for overall accuracy --
+    oa_ok = has_var & ~np.isnan(UA_w)
+    var_oa = np.where(oa_ok, w2 * UA_w * (1.0 - UA_w) / dof, 0.0).sum()
+    se_oa = np.sqrt(var_oa)
+
+    return (A_hat, A_lo, A_hi, OA_w, OA_w - z * se_oa, OA_w + z * se_oa,
+            UA_w, PA_w)
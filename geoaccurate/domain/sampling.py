@@ -7,7 +7,7 @@ No QGIS or Qt imports. Only depends on: numpy, typing.
 scipy.spatial.cKDTree used if available, with brute-force fallback.
 """
 
-from typing import Callable, Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 
@@ -21,6 +21,15 @@ try:
 except ImportError:
     _HAS_SCIPY = False
 
+# Identifies the random stream layout behind a seed; recorded with each
+# SampleDesign so a seed can be matched to the release that produced it.
+# Bump when a change makes the same seed select different points.
+# v1 (<= 1.3.1): legacy RandomState(seed) streams, one shared by all
+#     classes for point selection and one for candidate subsampling.
+# v2: a PCG64 Generator per class from SeedSequence(seed).spawn(), and
+#     default_rng(seed) for candidate subsampling.
+RNG_SCHEME = "pcg64-seedsequence-spawn-v2"
+
 
 def generate_stratified_random(
     candidates_per_class: Dict[int, np.ndarray],
@@ -28,7 +37,11 @@ def generate_stratified_random(
     min_distance: float = 0.0,
     seed: int = 42,
     progress_callback: Optional[Callable[[int, int], None]] = None,
-) -> Tuple[List[SamplePoint], List[str]]:
+    return_arrays: bool = False,
+) -> Union[
+    Tuple[List[SamplePoint], List[str]],
+    Tuple[List[SamplePoint], np.ndarray, List[str]],
+]:
     """Generate stratified random sample points from candidate coordinates.
 
     Args:
@@ -38,19 +51,28 @@ def generate_stratified_random(
         min_distance: Minimum distance between any two selected points (map units).
         seed: Random seed for reproducibility.
         progress_callback: Optional (current, total) progress reporter.
+        return_arrays: Also return the selected coordinates as an Nx2
+            float array (same order as the points), so callers that only
+            need coordinates don't have to unpack SamplePoints.
 
     Returns:
-        (list of SamplePoints, list of warning messages)
+        (list of SamplePoints, list of warning messages), or
+        (list of SamplePoints, Nx2 coordinate array, list of warning
+        messages) if return_arrays is True.
     """
-    rng = np.random.RandomState(seed)
+    classes = sorted(n_per_class.keys())
+    total_classes = len(classes)
+
+    # One independent PCG64 stream per stratum, derived from the seed
+    class_rngs = [
+        np.random.default_rng(child)
+        for child in np.random.SeedSequence(seed).spawn(total_classes)
+    ]
     all_selected_coords: List[np.ndarray] = []
     all_points: List[SamplePoint] = []
     warnings: List[str] = []
     point_id = 1
 
-    classes = sorted(n_per_class.keys())
-    total_classes = len(classes)
-
     for cls_idx, class_val in enumerate(classes):
         if class_val not in candidates_per_class:
             warnings.append(
@@ -74,7 +96,7 @@ def generate_stratified_random(
             continue
 
         # Shuffle candidates
-        indices = rng.permutation(len(coords))
+        indices = class_rngs[cls_idx].permutation(len(coords))
         coords = coords[indices]
 
         selected = []
@@ -107,6 +129,9 @@ def generate_stratified_random(
         if progress_callback:
             progress_callback(cls_idx + 1, total_classes)
 
+    if return_arrays:
+        coords = np.array(all_selected_coords, dtype=float).reshape(-1, 2)
+        return all_points, coords, warnings
     return all_points, warnings
 
 
@@ -676,9 +676,9 @@ class SamplePanel(QWidget):
                 selected = self._select_points_per_aoi(result.points)
                 self._update_aoi_generated_counts(selected)
                 from ..domain.models import SampleSet
-                result = SampleSet(
+                result = SampleSet.from_points(
                     design=result.design,
-                    points=tuple(selected),
+                    points=selected,
                     strata_info=result.strata_info,
                     warnings=result.warnings,
                 )
@@ -686,7 +686,7 @@ class SamplePanel(QWidget):
             self._sample_result = result
             self.btn_export.setEnabled(True)
 
-            n_points = len(result.points)
+            n_points = len(result)
             self.iface.messageBar().pushMessage(
                 "GeoAccuRate",
                 f"Generated {n_points} reference sample points "
@@ -797,12 +797,17 @@ class SamplePanel(QWidget):
                 cls: getattr(self, "_class_names", {}).get(cls, str(cls))
                 for cls in self._pixel_counts
             }
+            design = self._sample_result.design
             export_sample_points(
                 list(self._sample_result.points),
                 path,
                 epsg,
                 class_names,
                 driver,
+                metadata={
+                    "geoaccurate_random_seed": str(design.random_seed),
+                    "geoaccurate_rng_scheme": design.rng_scheme,
+                },
             )
             self.iface.messageBar().pushMessage(
                 "GeoAccuRate",
@@ -8,7 +8,7 @@ Depends on: matplotlib, numpy.
 
 import io
 import math
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 import numpy as np
 
@@ -46,9 +46,19 @@ def is_available() -> bool:
 def render_confusion_matrix_heatmap(
     result: ConfusionMatrixResult,
     figsize: Tuple[float, float] = (8, 6),
+    matrix: Optional[np.ndarray] = None,
+    labels: Optional[List[str]] = None,
 ) -> Optional[bytes]:
     """Render confusion matrix as a heatmap.
 
+    Args:
+        result: Accuracy result; its matrix and class names are used
+            unless matrix and labels are given.
+        figsize: Figure size in inches.
+        matrix: Matrix to draw instead of result.matrix (e.g. the
+            report's display matrix with rare classes merged).
+        labels: Axis labels matching matrix.
+
     Returns:
         PNG image bytes, or None if matplotlib unavailable.
     """
@@ -58,11 +68,13 @@ def render_confusion_matrix_heatmap(
     with plt.rc_context(STYLE):
         fig, ax = plt.subplots(figsize=figsize)
 
-        matrix = result.matrix
+        if matrix is None:
+            matrix = result.matrix
+            labels = [
+                result.class_names.get(lbl, str(lbl))
+                for lbl in result.class_labels
+            ]
         k = matrix.shape[0]
-        labels = [
-            result.class_names.get(lbl, str(lbl)) for lbl in result.class_labels
-        ]
 
         im = ax.imshow(matrix, cmap="YlOrRd", aspect="auto")
 
@@ -6,6 +6,9 @@ of a journal article. Includes proper citations.
 No QGIS or Qt imports. Only depends on: domain models.
 """
 
+import functools
+from typing import Optional, Tuple
+
 from ..domain.models import ConfusionMatrixResult, RunMetadata
 
 
@@ -24,17 +27,51 @@ def generate_methods_text(
     Returns:
         Multi-paragraph methods text with citations.
     """
-    n_classes = len(result.class_labels)
-    oa = result.overall_accuracy
-    oa_lo, oa_hi = result.overall_accuracy_ci
-    qd = result.quantity_disagreement
-    ad = result.allocation_disagreement
+    aw = result.area_weighted
+    return _build_methods_text(
+        n_samples=result.n_samples,
+        n_classes=len(result.class_labels),
+        n_excluded_nodata=result.n_excluded_nodata,
+        oa=result.overall_accuracy,
+        oa_ci=tuple(result.overall_accuracy_ci),
+        qd=result.quantity_disagreement,
+        ad=result.allocation_disagreement,
+        kappa=result.kappa,
+        aw_oa=aw.overall_accuracy_weighted if aw is not None else None,
+        aw_oa_ci=tuple(aw.overall_accuracy_weighted_ci) if aw is not None else None,
+        plugin_version=metadata.plugin_version,
+        qgis_version=metadata.qgis_version,
+        sampling_info=sampling_info,
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _build_methods_text(
+    n_samples: int,
+    n_classes: int,
+    n_excluded_nodata: int,
+    oa: float,
+    oa_ci: Tuple[float, float],
+    qd: float,
+    ad: float,
+    kappa: Optional[float],
+    aw_oa: Optional[float],
+    aw_oa_ci: Optional[Tuple[float, float]],
+    plugin_version: str,
+    qgis_version: str,
+    sampling_info: str,
+) -> str:
+    """Assemble the methods text from the scalar fields it depends on.
+
+    Cached so batch report runs over the same result reuse the text.
+    """
+    oa_lo, oa_hi = oa_ci
 
     paragraphs = []
 
     # Paragraph 1: Sampling and matrix construction
     p1 = (
-        f"Accuracy assessment was conducted using {result.n_samples} "
+        f"Accuracy assessment was conducted using {n_samples} "
         f"reference samples across {n_classes} land cover classes"
     )
     if sampling_info:
@@ -44,9 +81,9 @@ def generate_methods_text(
         "of Congalton and Green (2019), with reference data in rows "
         "and classified data in columns."
     )
-    if result.n_excluded_nodata > 0:
+    if n_excluded_nodata > 0:
         p1 += (
-            f" {result.n_excluded_nodata} sample(s) were excluded "
+            f" {n_excluded_nodata} sample(s) were excluded "
             f"due to nodata values in the classified raster."
         )
     paragraphs.append(p1)
@@ -61,15 +98,13 @@ def generate_methods_text(
         f"more interpretable decomposition of error than the "
         f"traditional Kappa coefficient."
     )
-    if result.kappa is not None:
-        p2 += f" Cohen\u2019s Kappa was {result.kappa:.4f}."
+    if kappa is not None:
+        p2 += f" Cohen\u2019s Kappa was {kappa:.4f}."
     paragraphs.append(p2)
 
     # Paragraph 3: Area-weighted (conditional)
-    if result.area_weighted is not None:
-        aw = result.area_weighted
-        aw_oa = aw.overall_accuracy_weighted
-        aw_lo, aw_hi = aw.overall_accuracy_weighted_ci
+    if aw_oa is not None:
+        aw_lo, aw_hi = aw_oa_ci
         # Clamp to [0%, 100%] for display
         aw_lo = max(0.0, aw_lo)
         aw_hi = min(1.0, aw_hi)
@@ -95,18 +130,19 @@ def generate_methods_text(
     # Paragraph 5: Tool attribution
     p5 = (
         f"All accuracy metrics were computed using the GeoAccuRate "
-        f"plugin (v{metadata.plugin_version}) for QGIS"
+        f"plugin (v{plugin_version}) for QGIS"
     )
-    if metadata.qgis_version:
-        p5 += f" {metadata.qgis_version}"
+    if qgis_version:
+        p5 += f" {qgis_version}"
     p5 += "."
     paragraphs.append(p5)
 
     return "\n\n".join(paragraphs)
 
 
+@functools.lru_cache(maxsize=1)
 def generate_references() -> str:
-    """Generate the references section for the report."""
+    """Generate the references section for the report (static, cached)."""
     return (
         "Congalton, R.G. and Green, K. (2019). Assessing the Accuracy "
         "of Remotely Sensed Data: Principles and Practices, 3rd ed. "
@@ -4,47 +4,121 @@ Generates publication-ready PDF reports with tables, charts,
 methods text, and provenance metadata.
 
 Depends on: reportlab (optional — graceful fallback if missing).
+ReportLab and matplotlib are imported on first use, not at module load.
 """
 
+import importlib.util
 import io
 import json
 import math
+import re
+import types
+from typing import TYPE_CHECKING, Tuple
 
+import numpy as np
 
 from ..domain.confusion_matrix import normalize_confusion_matrix
 from ..domain.models import ConfusionMatrixResult, ReportContent, RunMetadata
-from .chart_renderer import (
-    render_area_comparison_chart,
-    render_confusion_matrix_heatmap,
-    render_pa_ua_bar_chart,
-)
 from .methods_text import generate_methods_text, generate_references
 
-# Try to import ReportLab
-_REPORTLAB_AVAILABLE = False
+if TYPE_CHECKING:
+    from reportlab.platypus import Table
+
+# Validator per-class sample-size warning, e.g. "Class 3 has only 12 reference samples"
+_PER_CLASS_RE = re.compile(r"^Class (\d+) has only (\d+) reference samples")
+
+# ReportLab handles, populated by _lazy_import_reportlab()
+_RL = types.SimpleNamespace(loaded=False)
+
+# orjson is optional; used for faster provenance serialization
 try:
-    from reportlab.lib import colors
-    from reportlab.lib.pagesizes import A4
-    from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
-    from reportlab.lib.units import cm, mm
-    from reportlab.platypus import (
-        Image,
-        PageBreak,
-        Paragraph,
-        SimpleDocTemplate,
-        Spacer,
-        Table,
-        TableStyle,
-    )
+    import orjson
 
-    _REPORTLAB_AVAILABLE = True
+    _HAS_ORJSON = True
 except ImportError:
-    pass
+    _HAS_ORJSON = False
 
 
 def is_pdf_available() -> bool:
-    """Check if PDF generation is available."""
-    return _REPORTLAB_AVAILABLE
+    """Check if PDF generation is available (without importing ReportLab)."""
+    return importlib.util.find_spec("reportlab") is not None
+
+
+# Confusion tables with more than _COLLAPSE_THRESHOLD classes merge
+# classes with fewer than _COLLAPSE_MIN_SUPPORT samples into "Other"
+_COLLAPSE_THRESHOLD = 15
+_COLLAPSE_MIN_SUPPORT = 10
+
+
+def _pct(v: float) -> str:
+    """Format a proportion as a percentage with one decimal ("\u2014" for NaN)."""
+    return "\u2014" if math.isnan(v) else "%.1f%%" % (v * 100.0)
+
+
+def _lazy_import_reportlab() -> types.SimpleNamespace:
+    """Import the ReportLab names used by this module, once."""
+    if not _RL.loaded:
+        from reportlab.lib import colors
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+        from reportlab.lib.units import cm, mm
+        from reportlab.platypus import (
+            BaseDocTemplate,
+            Frame,
+            Image,
+            PageBreak,
+            PageTemplate,
+            Paragraph,
+            Spacer,
+            Table,
+            TableStyle,
+        )
+
+        _RL.__dict__.update(
+            colors=colors,
+            A4=A4,
+            ParagraphStyle=ParagraphStyle,
+            getSampleStyleSheet=getSampleStyleSheet,
+            cm=cm,
+            mm=mm,
+            BaseDocTemplate=BaseDocTemplate,
+            Frame=Frame,
+            Image=Image,
+            PageBreak=PageBreak,
+            PageTemplate=PageTemplate,
+            Paragraph=Paragraph,
+            Spacer=Spacer,
+            Table=Table,
+            TableStyle=TableStyle,
+        )
+        _RL.loaded = True
+    return _RL
+
+
+def _make_template(output_path: str):
+    """Create the A4 document template used for every report.
+
+    A BaseDocTemplate with a single "main" page template, equivalent to
+    SimpleDocTemplate's layout but without its per-build First/Later
+    template setup. Templates and frames are built per document rather
+    than shared: reports run in background tasks, and ReportLab frames
+    carry layout state while a document is being built.
+    """
+    doc = _RL.BaseDocTemplate(
+        output_path,
+        pagesize=_RL.A4,
+        leftMargin=2 * _RL.cm,
+        rightMargin=2 * _RL.cm,
+        topMargin=2 * _RL.cm,
+        bottomMargin=2 * _RL.cm,
+        pageCompression=1,  # zlib-compress page content streams
+        invariant=1,        # deterministic output for identical inputs
+    )
+    frame = _RL.Frame(
+        doc.leftMargin, doc.bottomMargin, doc.width, doc.height, id="normal",
+    )
+    doc.addPageTemplates([_RL.PageTemplate(id="main", frames=[frame])])
+    return doc
 
 
 def generate_pdf(content: ReportContent, output_path: str) -> str:
@@ -60,36 +134,46 @@ def generate_pdf(content: ReportContent, output_path: str) -> str:
     Raises:
         ImportError: If ReportLab is not installed.
     """
-    if not _REPORTLAB_AVAILABLE:
+    if not is_pdf_available():
         raise ImportError(
             "PDF generation requires ReportLab. Install it via: "
             "pip install reportlab"
         )
+    _lazy_import_reportlab()
+    from .chart_renderer import (
+        render_area_comparison_chart,
+        render_confusion_matrix_heatmap,
+        render_pa_ua_bar_chart,
+    )
 
     result = content.result
     metadata = content.metadata
+    # Display names in class_labels order, shared by all table builders
+    label_names = [
+        result.class_names.get(lbl, str(lbl)) for lbl in result.class_labels
+    ]
 
-    doc = SimpleDocTemplate(
-        output_path,
-        pagesize=A4,
-        leftMargin=2 * cm,
-        rightMargin=2 * cm,
-        topMargin=2 * cm,
-        bottomMargin=2 * cm,
-    )
+    doc = _make_template(output_path)
 
-    styles = getSampleStyleSheet()
+    styles = _RL.getSampleStyleSheet()
     title_style = styles["Title"]
     h1 = styles["Heading1"]
     h2 = styles["Heading2"]
     body = styles["BodyText"]
-    body_small = ParagraphStyle("BodySmall", parent=body, fontSize=8)
+    body_small = _RL.ParagraphStyle("BodySmall", parent=body, fontSize=8)
+    # Key/value blocks are one <br/>-joined Paragraph each; the extra
+    # leading reproduces the spaceBefore of one Paragraph per line.
+    body_lines = _RL.ParagraphStyle(
+        "BodyLines", parent=body, leading=body.leading + body.spaceBefore)
+    body_small_lines = _RL.ParagraphStyle(
+        "BodySmallLines", parent=body_small,
+        leading=body_small.leading + body_small.spaceBefore)
 
     elements = []
 
     # ── Title ──
-    elements.append(Paragraph("GeoAccuRate \u2014 Accuracy Assessment Report", title_style))
-    elements.append(Spacer(1, 6 * mm))
+    elements.append(_RL.Paragraph("GeoAccuRate \u2014 Accuracy Assessment Report", title_style))
+    elements.append(_RL.Spacer(1, 6 * _RL.mm))
 
     author_display = content.author if content.author else "Not specified"
     meta_lines = [
@@ -102,13 +186,12 @@ def generate_pdf(content: ReportContent, output_path: str) -> str:
         meta_lines.append(f"<b>QGIS:</b> {metadata.qgis_version}")
     if content.project_name:
         meta_lines.append(f"<b>Project:</b> {content.project_name}")
-    for line in meta_lines:
-        elements.append(Paragraph(line, body))
-    elements.append(Spacer(1, 8 * mm))
+    elements.append(_RL.Paragraph("<br/>".join(meta_lines), body_lines))
+    elements.append(_RL.Spacer(1, 8 * _RL.mm))
 
     # ── 1. Input Summary ──
-    elements.append(Spacer(1, 2 * mm))
-    elements.append(Paragraph("1. Input Summary", h1))
+    elements.append(_RL.Spacer(1, 2 * _RL.mm))
+    elements.append(_RL.Paragraph("1. Input Summary", h1))
     # Show layer names (not raw URIs which can be unreadable for memory layers)
     classified_display = metadata.classified_layer_name or metadata.classified_layer_path
     reference_display = metadata.reference_layer_name or metadata.reference_layer_path
@@ -121,37 +204,52 @@ def generate_pdf(content: ReportContent, output_path: str) -> str:
         f"<b>Classes:</b> {len(result.class_labels)}",
         f"<b>Total samples:</b> {result.n_samples} ({result.n_excluded_nodata} excluded: nodata)",
     ]
-    for line in input_lines:
-        elements.append(Paragraph(line, body))
-    elements.append(Spacer(1, 6 * mm))
+    elements.append(_RL.Paragraph("<br/>".join(input_lines), body_lines))
+    elements.append(_RL.Spacer(1, 6 * _RL.mm))
+
+    footnote = _RL.ParagraphStyle("Footnote", parent=body_small, fontSize=7,
+                                  textColor=_RL.colors.Color(0.4, 0.4, 0.4))
 
     # ── 2. Confusion Matrix ──
-    elements.append(Spacer(1, 2 * mm))
-    elements.append(Paragraph("2. Confusion Matrix", h1))
-    elements.append(_build_confusion_table(result, styles))
-    elements.append(Spacer(1, 6 * mm))
+    # Large class sets are shown with rare classes merged into "Other"
+    table_matrix, table_names, n_collapsed = _maybe_collapse_rare_classes(
+        result.matrix, label_names
+    )
+    elements.append(_RL.Spacer(1, 2 * _RL.mm))
+    elements.append(_RL.Paragraph("2. Confusion Matrix", h1))
+    has_other = n_collapsed > 0
+    elements.append(_build_confusion_table(
+        table_matrix, table_names, styles, has_other=has_other))
+    if has_other:
+        elements.append(_RL.Paragraph(
+            f"{n_collapsed} classes with fewer than {_COLLAPSE_MIN_SUPPORT} "
+            f"samples (row + column total) are merged into \u201cOther\u201d "
+            f"for display. The Other/Other cell also counts confusion "
+            f"between merged classes, so it is not an agreement count. "
+            f"All metrics are computed from the full "
+            f"{len(label_names)}-class matrix.", footnote))
+    elements.append(_RL.Spacer(1, 6 * _RL.mm))
 
     # ── Table B: Row-Normalized Confusion Matrix ──
-    elements.append(Paragraph("Table B: Row-Normalized Confusion Matrix (%)", h2))
-    elements.append(Paragraph(
+    elements.append(_RL.Paragraph("Table B: Row-Normalized Confusion Matrix (%)", h2))
+    elements.append(_RL.Paragraph(
         "Each cell shows the percentage of reference samples in that row "
         "classified into each column class.", body_small))
-    elements.append(Spacer(1, 2 * mm))
-    elements.append(_build_normalized_confusion_table(result, styles))
-    elements.append(Spacer(1, 6 * mm))
+    elements.append(_RL.Spacer(1, 2 * _RL.mm))
+    elements.append(_build_normalized_confusion_table(
+        table_matrix, table_names, styles, has_other=has_other))
+    elements.append(_RL.Spacer(1, 6 * _RL.mm))
 
     # ── 3. Accuracy Metrics ──
-    elements.append(Paragraph("3. Accuracy Metrics", h1))
+    elements.append(_RL.Paragraph("3. Accuracy Metrics", h1))
     elements.append(_build_summary_table(result, styles))
-    footnote = ParagraphStyle("Footnote", parent=body_small, fontSize=7,
-                              textColor=colors.Color(0.4, 0.4, 0.4))
-    elements.append(Paragraph(
+    elements.append(_RL.Paragraph(
         "Confidence intervals constrained to logical bounds.", footnote))
-    elements.append(Spacer(1, 4 * mm))
+    elements.append(_RL.Spacer(1, 4 * _RL.mm))
 
-    elements.append(Paragraph("3.1 Per-Class Metrics", h2))
-    elements.append(_build_per_class_table(result, styles))
-    elements.append(Spacer(1, 6 * mm))
+    elements.append(_RL.Paragraph("3.1 Per-Class Metrics", h2))
+    elements.append(_build_per_class_table(result, label_names, styles))
+    elements.append(_RL.Spacer(1, 6 * _RL.mm))
 
     # ── Interpretation Notes (conditional) ──
     interp_notes = _build_interpretation_notes(content, styles)
@@ -159,71 +257,71 @@ def generate_pdf(content: ReportContent, output_path: str) -> str:
 
     # ── 4. Area-Weighted Results ──
     if result.area_weighted is not None:
-        elements.append(Paragraph("4. Area-Weighted Results (Olofsson et al. 2014)", h1))
-        elements.append(_build_area_table(result, styles))
-        elements.append(Spacer(1, 6 * mm))
+        elements.append(_RL.Paragraph("4. Area-Weighted Results (Olofsson et al. 2014)", h1))
+        elements.append(_build_area_table(result, label_names, styles))
+        elements.append(_RL.Spacer(1, 6 * _RL.mm))
 
     # ── 5. Figures ──
-    elements.append(Spacer(1, 2 * mm))
-    elements.append(Paragraph("5. Figures", h1))
+    elements.append(_RL.Spacer(1, 2 * _RL.mm))
+    elements.append(_RL.Paragraph("5. Figures", h1))
 
-    heatmap = render_confusion_matrix_heatmap(result)
+    heatmap = render_confusion_matrix_heatmap(
+        result, matrix=table_matrix, labels=table_names)
     if heatmap:
-        elements.append(Paragraph("Figure 1: Confusion Matrix Heatmap", body))
-        elements.append(Image(io.BytesIO(heatmap), width=14 * cm, height=10 * cm))
-        elements.append(Spacer(1, 4 * mm))
+        elements.append(_RL.Paragraph("Figure 1: Confusion Matrix Heatmap", body))
+        elements.append(_RL.Image(io.BytesIO(heatmap), width=14 * _RL.cm, height=10 * _RL.cm))
+        elements.append(_RL.Spacer(1, 4 * _RL.mm))
 
     bar_chart = render_pa_ua_bar_chart(result)
     if bar_chart:
-        elements.append(Paragraph("Figure 2: Producer's and User's Accuracy by Class", body))
-        elements.append(Image(io.BytesIO(bar_chart), width=14 * cm, height=7 * cm))
-        elements.append(Spacer(1, 4 * mm))
+        elements.append(_RL.Paragraph("Figure 2: Producer's and User's Accuracy by Class", body))
+        elements.append(_RL.Image(io.BytesIO(bar_chart), width=14 * _RL.cm, height=7 * _RL.cm))
+        elements.append(_RL.Spacer(1, 4 * _RL.mm))
 
     area_chart = render_area_comparison_chart(result)
     if area_chart:
-        elements.append(Paragraph("Figure 3: Mapped vs Estimated Area", body))
-        elements.append(Image(io.BytesIO(area_chart), width=14 * cm, height=7 * cm))
-        elements.append(Spacer(1, 4 * mm))
+        elements.append(_RL.Paragraph("Figure 3: Mapped vs Estimated Area", body))
+        elements.append(_RL.Image(io.BytesIO(area_chart), width=14 * _RL.cm, height=7 * _RL.cm))
+        elements.append(_RL.Spacer(1, 4 * _RL.mm))
 
     # ── 6. Methods ──
-    elements.append(PageBreak())
-    elements.append(Paragraph("6. Methods", h1))
+    elements.append(_RL.PageBreak())
+    elements.append(_RL.Paragraph("6. Methods", h1))
     methods = generate_methods_text(result, metadata)
     for para in methods.split("\n\n"):
-        elements.append(Paragraph(para, body))
-        elements.append(Spacer(1, 2 * mm))
+        elements.append(_RL.Paragraph(para, body))
+        elements.append(_RL.Spacer(1, 2 * _RL.mm))
 
     # ── 7. References ──
-    elements.append(Spacer(1, 6 * mm))
-    elements.append(Paragraph("7. References", h1))
+    elements.append(_RL.Spacer(1, 6 * _RL.mm))
+    elements.append(_RL.Paragraph("7. References", h1))
     refs = generate_references()
     for ref in refs.split("\n\n"):
-        elements.append(Paragraph(ref, body_small))
-        elements.append(Spacer(1, 2 * mm))
+        elements.append(_RL.Paragraph(ref, body_small))
+        elements.append(_RL.Spacer(1, 2 * _RL.mm))
 
     # ── 8. ISO 19157 Quality Element Mapping ──
-    elements.append(Spacer(1, 6 * mm))
-    elements.append(Paragraph("8. ISO 19157 Quality Element Mapping", h1))
+    elements.append(_RL.Spacer(1, 6 * _RL.mm))
+    elements.append(_RL.Paragraph("8. ISO 19157 Quality Element Mapping", h1))
     elements.append(_build_iso19157_table(styles))
-    iso_disclaimer = ParagraphStyle("ISODisclaimer", parent=body_small, fontSize=7,
-                                    textColor=colors.Color(0.4, 0.4, 0.4),
-                                    fontName="Helvetica-Oblique")
-    elements.append(Spacer(1, 2 * mm))
-    elements.append(Paragraph(
+    iso_disclaimer = _RL.ParagraphStyle("ISODisclaimer", parent=body_small, fontSize=7,
+                                        textColor=_RL.colors.Color(0.4, 0.4, 0.4),
+                                        fontName="Helvetica-Oblique")
+    elements.append(_RL.Spacer(1, 2 * _RL.mm))
+    elements.append(_RL.Paragraph(
         "This mapping is informational and does not constitute "
         "formal ISO certification.", iso_disclaimer))
-    elements.append(Spacer(1, 4 * mm))
+    elements.append(_RL.Spacer(1, 4 * _RL.mm))
 
     # ── 9. Provenance ──
-    elements.append(Spacer(1, 6 * mm))
-    elements.append(Paragraph("9. Provenance", h1))
+    elements.append(_RL.Spacer(1, 6 * _RL.mm))
+    elements.append(_RL.Paragraph("9. Provenance", h1))
     prov_lines = [
         f"<b>Timestamp:</b> {metadata.timestamp}",
         f"<b>Plugin version:</b> {metadata.plugin_version}",
         f"<b>Parameters:</b> {json.dumps(metadata.parameters, indent=2)}",
     ]
-    for line in prov_lines:
-        elements.append(Paragraph(line, body_small))
+    elements.append(_RL.Paragraph("<br/>".join(prov_lines), body_small_lines))
 
     # Build PDF
     doc.build(elements)
@@ -235,35 +333,79 @@ def generate_pdf(content: ReportContent, output_path: str) -> str:
     return output_path
 
 
-def _build_confusion_table(result: ConfusionMatrixResult, styles) -> Table:
-    """Build confusion matrix as a ReportLab Table."""
-    labels = [result.class_names.get(lbl, str(lbl)) for lbl in result.class_labels]
+def _maybe_collapse_rare_classes(
+    matrix: np.ndarray,
+    label_names: list,
+    threshold: int = _COLLAPSE_THRESHOLD,
+    min_support: int = _COLLAPSE_MIN_SUPPORT,
+) -> Tuple[np.ndarray, list, int]:
+    """Merge rare classes into an "Other" row/column for display.
+
+    Only applies when there are more than ``threshold`` classes. A class
+    is rare when its support (row total + column total) is below
+    ``min_support``; rare classes are summed into a trailing "Other"
+    class and all other classes are kept. Nothing is merged if fewer
+    than two classes are rare or if every class is rare.
+
+    Returns:
+        (matrix, names, n_collapsed). The input is returned unchanged
+        with n_collapsed = 0 when no collapse is needed.
+    """
+    k = matrix.shape[0]
+    if k <= threshold:
+        return matrix, label_names, 0
+
+    support = matrix.sum(axis=0) + matrix.sum(axis=1)
+    is_rare = support < min_support
+    keep = np.flatnonzero(~is_rare)
+    rare = np.flatnonzero(is_rare)
+    if len(rare) < 2 or len(keep) == 0:
+        return matrix, label_names, 0
+
+    n = len(keep)
+    collapsed = np.zeros((n + 1, n + 1), dtype=matrix.dtype)
+    collapsed[:n, :n] = matrix[np.ix_(keep, keep)]
+    collapsed[:n, n] = matrix[np.ix_(keep, rare)].sum(axis=1)
+    collapsed[n, :n] = matrix[np.ix_(rare, keep)].sum(axis=0)
+    collapsed[n, n] = matrix[np.ix_(rare, rare)].sum()
+
+    names = [label_names[i] for i in keep] + ["Other"]
+    return collapsed, names, len(rare)
+
+
+def _build_confusion_table(
+    matrix: np.ndarray, label_names: list, styles, has_other: bool = False
+) -> "Table":
+    """Build confusion matrix as a ReportLab Table.
+
+    If has_other is True the last class is the merged "Other" class and
+    its diagonal cell is not highlighted as agreement.
+    """
+    labels = label_names
     k = len(labels)
-    matrix = result.matrix
+
+    # Cast once to integer counts; reductions and tolist() then stay integral
+    m = np.ascontiguousarray(matrix, dtype=np.int64)
+    row_totals = m.sum(axis=1).tolist()
+    col_totals = m.sum(axis=0).tolist()
+    grand_total = sum(row_totals)
+    cells = m.tolist()
 
     # Header row
     header = ["Ref \\ Cls"] + labels + ["Row Total"]
     data = [header]
 
     for i in range(k):
-        row = [labels[i]]
-        for j in range(k):
-            row.append(str(int(matrix[i, j])))
-        row.append(str(int(matrix[i, :].sum())))
-        data.append(row)
+        data.append([labels[i]] + [str(v) for v in cells[i]] + [str(row_totals[i])])
 
     # Column totals row
-    col_totals = ["Col Total"]
-    for j in range(k):
-        col_totals.append(str(int(matrix[:, j].sum())))
-    col_totals.append(str(int(matrix.sum())))
-    data.append(col_totals)
-
-    table = Table(data)
-    table.setStyle(TableStyle([
-        ("BACKGROUND", (0, 0), (-1, 0), colors.Color(0.8, 0.8, 0.8)),
-        ("BACKGROUND", (0, 0), (0, -1), colors.Color(0.9, 0.9, 0.9)),
-        ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
+    data.append(["Col Total"] + [str(v) for v in col_totals] + [str(grand_total)])
+
+    table = _RL.Table(data)
+    table.setStyle(_RL.TableStyle([
+        ("BACKGROUND", (0, 0), (-1, 0), _RL.colors.Color(0.8, 0.8, 0.8)),
+        ("BACKGROUND", (0, 0), (0, -1), _RL.colors.Color(0.9, 0.9, 0.9)),
+        ("GRID", (0, 0), (-1, -1), 0.5, _RL.colors.black),
         ("FONTSIZE", (0, 0), (-1, -1), 8),
         ("ALIGN", (1, 1), (-1, -1), "CENTER"),
         ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
@@ -271,23 +413,23 @@ def _build_confusion_table(result: ConfusionMatrixResult, styles) -> Table:
     ]))
 
     # Highlight diagonal
-    for i in range(k):
-        table.setStyle(TableStyle([
+    for i in range(k - 1 if has_other else k):
+        table.setStyle(_RL.TableStyle([
             ("BACKGROUND", (i + 1, i + 1), (i + 1, i + 1),
-             colors.Color(0.85, 0.95, 0.85)),
+             _RL.colors.Color(0.85, 0.95, 0.85)),
         ]))
 
     return table
 
 
-def _build_summary_table(result: ConfusionMatrixResult, styles) -> Table:
+def _build_summary_table(result: ConfusionMatrixResult, styles) -> "Table":
     """Build summary metrics table."""
     data = [["Metric", "Value", "95% CI"]]
 
     oa = result.overall_accuracy
     oa_lo, oa_hi = result.overall_accuracy_ci
     oa_lo, oa_hi = max(0.0, oa_lo), min(1.0, oa_hi)
-    data.append(["Overall Accuracy", f"{oa:.1%}", f"{oa_lo:.1%} \u2013 {oa_hi:.1%}"])
+    data.append(["Overall Accuracy", _pct(oa), f"{_pct(oa_lo)} \u2013 {_pct(oa_hi)}"])
 
     data.append(["Quantity Disagreement", f"{result.quantity_disagreement:.4f}", "\u2014"])
     data.append(["Allocation Disagreement", f"{result.allocation_disagreement:.4f}", "\u2014"])
@@ -307,14 +449,14 @@ def _build_summary_table(result: ConfusionMatrixResult, styles) -> Table:
         aw_hi = min(1.0, aw_hi)
         data.append([
             "Area-Weighted OA",
-            f"{aw.overall_accuracy_weighted:.1%}",
-            f"{aw_lo:.1%} \u2013 {aw_hi:.1%}",
+            _pct(aw.overall_accuracy_weighted),
+            f"{_pct(aw_lo)} \u2013 {_pct(aw_hi)}",
         ])
 
-    table = Table(data, colWidths=[5 * cm, 3 * cm, 4 * cm])
-    table.setStyle(TableStyle([
-        ("BACKGROUND", (0, 0), (-1, 0), colors.Color(0.8, 0.8, 0.8)),
-        ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
+    table = _RL.Table(data, colWidths=[5 * _RL.cm, 3 * _RL.cm, 4 * _RL.cm])
+    table.setStyle(_RL.TableStyle([
+        ("BACKGROUND", (0, 0), (-1, 0), _RL.colors.Color(0.8, 0.8, 0.8)),
+        ("GRID", (0, 0), (-1, -1), 0.5, _RL.colors.black),
         ("FONTSIZE", (0, 0), (-1, -1), 9),
         ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
         ("ALIGN", (1, 0), (-1, -1), "CENTER"),
@@ -322,34 +464,49 @@ def _build_summary_table(result: ConfusionMatrixResult, styles) -> Table:
     return table
 
 
-def _build_per_class_table(result: ConfusionMatrixResult, styles) -> Table:
+def _build_per_class_table(
+    result: ConfusionMatrixResult, label_names: list, styles
+) -> "Table":
     """Build per-class metrics table."""
+    labels = result.class_labels
+    nan = float("nan")
+
+    pa = np.array([result.producers_accuracy.get(lbl, nan) for lbl in labels],
+                  dtype=np.float64)
+    ua = np.array([result.users_accuracy.get(lbl, nan) for lbl in labels],
+                  dtype=np.float64)
+    f1 = np.array([result.f1_per_class.get(lbl, nan) for lbl in labels],
+                  dtype=np.float64)
+    pa_ci = np.array([result.producers_accuracy_ci.get(lbl, (0.0, 0.0)) for lbl in labels],
+                     dtype=np.float64).reshape(-1, 2)
+    ua_ci = np.array([result.users_accuracy_ci.get(lbl, (0.0, 0.0)) for lbl in labels],
+                     dtype=np.float64).reshape(-1, 2)
+
+    def fmt(v):
+        return np.where(
+            np.isnan(v), "\u2014", np.char.mod("%.1f%%", v * 100.0)
+        ).tolist()
+
+    def fmt_ci(ci):
+        lo = np.maximum(ci[:, 0], 0.0)
+        hi = np.minimum(ci[:, 1], 1.0)
+        ranges = np.char.add(
+            np.char.add(np.char.mod("%.1f%%", lo * 100.0), "\u2013"),
+            np.char.mod("%.1f%%", hi * 100.0),
+        )
+        return np.where(np.isnan(ci[:, 0]), "\u2014", ranges).tolist()
+
     data = [["Class", "PA", "PA CI", "UA", "UA CI", "F1"]]
+    data.extend(
+        list(row) for row in zip(
+            label_names, fmt(pa), fmt_ci(pa_ci), fmt(ua), fmt_ci(ua_ci), fmt(f1)
+        )
+    )
 
-    for label in result.class_labels:
-        name = result.class_names.get(label, str(label))
-        pa = result.producers_accuracy.get(label, float("nan"))
-        ua = result.users_accuracy.get(label, float("nan"))
-        f1 = result.f1_per_class.get(label, float("nan"))
-        pa_ci = result.producers_accuracy_ci.get(label, (0, 0))
-        ua_ci = result.users_accuracy_ci.get(label, (0, 0))
-
-        def fmt(v):
-            return f"{v:.1%}" if not math.isnan(v) else "\u2014"
-
-        def fmt_ci(ci):
-            lo, hi = ci
-            if math.isnan(lo):
-                return "\u2014"
-            lo, hi = max(0.0, lo), min(1.0, hi)
-            return f"{lo:.1%}\u2013{hi:.1%}"
-
-        data.append([name, fmt(pa), fmt_ci(pa_ci), fmt(ua), fmt_ci(ua_ci), fmt(f1)])
-
-    table = Table(data)
-    table.setStyle(TableStyle([
-        ("BACKGROUND", (0, 0), (-1, 0), colors.Color(0.8, 0.8, 0.8)),
-        ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
+    table = _RL.Table(data)
+    table.setStyle(_RL.TableStyle([
+        ("BACKGROUND", (0, 0), (-1, 0), _RL.colors.Color(0.8, 0.8, 0.8)),
+        ("GRID", (0, 0), (-1, -1), 0.5, _RL.colors.black),
         ("FONTSIZE", (0, 0), (-1, -1), 8),
         ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
         ("ALIGN", (1, 0), (-1, -1), "CENTER"),
@@ -357,46 +514,59 @@ def _build_per_class_table(result: ConfusionMatrixResult, styles) -> Table:
     return table
 
 
-def _build_area_table(result: ConfusionMatrixResult, styles) -> Table:
+def _build_area_table(
+    result: ConfusionMatrixResult, label_names: list, styles
+) -> "Table":
     """Build area-weighted results table."""
     aw = result.area_weighted
     if aw is None:
-        return Table([["Area-weighted analysis not available"]])
+        return _RL.Table([["Area-weighted analysis not available"]])
+
+    labels = result.class_labels
+    k = len(labels)
 
-    total_mapped = sum(aw.mapped_area_ha.get(lbl, 0) for lbl in result.class_labels)
+    # Gather per-class values into parallel arrays up front
+    mapped = np.fromiter(
+        (aw.mapped_area_ha.get(lbl, 0.0) for lbl in labels),
+        dtype=np.float64, count=k,
+    )
+    est = np.fromiter(
+        (aw.estimated_area_ha.get(lbl, 0.0) for lbl in labels),
+        dtype=np.float64, count=k,
+    )
+    ci = np.array(
+        [aw.estimated_area_ci_ha.get(lbl, (0.0, 0.0)) for lbl in labels],
+        dtype=np.float64,
+    ).reshape(k, 2)
+    pa_w = [aw.producers_accuracy_weighted.get(lbl, float("nan")) for lbl in labels]
+    ua_w = [aw.users_accuracy_weighted.get(lbl, float("nan")) for lbl in labels]
+
+    total_mapped = float(mapped.sum())
+
+    # Clamp area CI to logical bounds [0, total_mapped]
+    ci_lo = np.maximum(ci[:, 0], 0.0)
+    ci_hi = np.minimum(ci[:, 1], total_mapped) if total_mapped > 0 else ci[:, 1]
+
+    def fmt_pct(v):
+        # Clamp to [0%, 100%]; NaN is passed through to _pct's placeholder
+        return _pct(v if math.isnan(v) else max(0.0, min(1.0, v)))
 
     data = [["Class", "Mapped (ha)", "Estimated (ha)", "Est. CI (ha)", "PA (weighted)", "UA (weighted)"]]
 
-    for label in result.class_labels:
-        name = result.class_names.get(label, str(label))
-        mapped = aw.mapped_area_ha.get(label, 0)
-        est = aw.estimated_area_ha.get(label, 0)
-        ci = aw.estimated_area_ci_ha.get(label, (0, 0))
-        pa_w = aw.producers_accuracy_weighted.get(label, float("nan"))
-        ua_w = aw.users_accuracy_weighted.get(label, float("nan"))
-
-        def fmt_pct(v):
-            if math.isnan(v):
-                return "\u2014"
-            v = max(0.0, min(1.0, v))
-            return f"{v:.1%}"
-
-        # Clamp area CI to logical bounds [0, total_mapped]
-        ci_lo = max(0, ci[0])
-        ci_hi = min(total_mapped, ci[1]) if total_mapped > 0 else ci[1]
+    for i, name in enumerate(label_names):
         data.append([
             name,
-            f"{mapped:,.0f}",
-            f"{est:,.0f}",
-            f"{ci_lo:,.0f}\u2013{ci_hi:,.0f}",
-            fmt_pct(pa_w),
-            fmt_pct(ua_w),
+            f"{mapped[i]:,.0f}",
+            f"{est[i]:,.0f}",
+            f"{ci_lo[i]:,.0f}\u2013{ci_hi[i]:,.0f}",
+            fmt_pct(pa_w[i]),
+            fmt_pct(ua_w[i]),
         ])
 
-    table = Table(data)
-    table.setStyle(TableStyle([
-        ("BACKGROUND", (0, 0), (-1, 0), colors.Color(0.8, 0.8, 0.8)),
-        ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
+    table = _RL.Table(data)
+    table.setStyle(_RL.TableStyle([
+        ("BACKGROUND", (0, 0), (-1, 0), _RL.colors.Color(0.8, 0.8, 0.8)),
+        ("GRID", (0, 0), (-1, -1), 0.5, _RL.colors.black),
         ("FONTSIZE", (0, 0), (-1, -1), 8),
         ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
         ("ALIGN", (1, 0), (-1, -1), "CENTER"),
@@ -405,12 +575,16 @@ def _build_area_table(result: ConfusionMatrixResult, styles) -> Table:
 
 
 def _build_normalized_confusion_table(
-    result: ConfusionMatrixResult, styles
-) -> Table:
-    """Build row-normalized confusion matrix as a ReportLab Table (%)."""
-    labels = [result.class_names.get(lbl, str(lbl)) for lbl in result.class_labels]
+    matrix: np.ndarray, label_names: list, styles, has_other: bool = False
+) -> "Table":
+    """Build row-normalized confusion matrix as a ReportLab Table (%).
+
+    If has_other is True the last class is the merged "Other" class and
+    its diagonal cell is not highlighted as agreement.
+    """
+    labels = label_names
     k = len(labels)
-    norm = normalize_confusion_matrix(result.matrix, axis=1)
+    norm = normalize_confusion_matrix(matrix, axis=1)
 
     header = ["Ref \\ Cls"] + labels + ["Row Total"]
     data = [header]
@@ -418,15 +592,15 @@ def _build_normalized_confusion_table(
     for i in range(k):
         row = [labels[i]]
         for j in range(k):
-            row.append(f"{norm[i, j]:.1f}%")
+            row.append("%.1f%%" % norm[i, j])
         row.append("100%")
         data.append(row)
 
-    table = Table(data)
-    table.setStyle(TableStyle([
-        ("BACKGROUND", (0, 0), (-1, 0), colors.Color(0.8, 0.8, 0.8)),
-        ("BACKGROUND", (0, 0), (0, -1), colors.Color(0.9, 0.9, 0.9)),
-        ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
+    table = _RL.Table(data)
+    table.setStyle(_RL.TableStyle([
+        ("BACKGROUND", (0, 0), (-1, 0), _RL.colors.Color(0.8, 0.8, 0.8)),
+        ("BACKGROUND", (0, 0), (0, -1), _RL.colors.Color(0.9, 0.9, 0.9)),
+        ("GRID", (0, 0), (-1, -1), 0.5, _RL.colors.black),
         ("FONTSIZE", (0, 0), (-1, -1), 8),
         ("ALIGN", (1, 1), (-1, -1), "CENTER"),
         ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
@@ -434,10 +608,10 @@ def _build_normalized_confusion_table(
     ]))
 
     # Highlight diagonal
-    for i in range(k):
-        table.setStyle(TableStyle([
+    for i in range(k - 1 if has_other else k):
+        table.setStyle(_RL.TableStyle([
             ("BACKGROUND", (i + 1, i + 1), (i + 1, i + 1),
-             colors.Color(0.85, 0.95, 0.85)),
+             _RL.colors.Color(0.85, 0.95, 0.85)),
         ]))
 
     return table
@@ -451,9 +625,10 @@ def _build_interpretation_notes(content: ReportContent, styles) -> list:
 
     Returns a list of Flowable elements (empty if no warnings apply).
     """
-    import re
-
     result = content.result
+    if result.n_samples >= 50 and not content.validation_warnings:
+        return []
+
     warnings = []
     seen = set()
 
@@ -465,11 +640,8 @@ def _build_interpretation_notes(content: ReportContent, styles) -> list:
         )
 
     # Forward validator warnings, deduplicating and enriching class names
-    _per_class_re = re.compile(
-        r"^Class (\d+) has only (\d+) reference samples"
-    )
     for w in content.validation_warnings:
-        m = _per_class_re.match(w)
+        m = _PER_CLASS_RE.match(w)
         if m:
             cls_val = int(m.group(1))
             count = m.group(2)
@@ -489,33 +661,33 @@ def _build_interpretation_notes(content: ReportContent, styles) -> list:
     if not warnings:
         return []
 
-    heading_style = ParagraphStyle(
+    heading_style = _RL.ParagraphStyle(
         "InterpHeading",
         parent=styles["Heading2"],
         fontName="Helvetica-BoldOblique",
     )
-    warn_style = ParagraphStyle(
+    warn_style = _RL.ParagraphStyle(
         "InterpWarning",
         parent=styles["BodyText"],
         fontSize=9,
-        textColor=colors.Color(0.4, 0.25, 0.0),
-        backColor=colors.Color(0.96, 0.96, 0.96),
+        textColor=_RL.colors.Color(0.4, 0.25, 0.0),
+        backColor=_RL.colors.Color(0.96, 0.96, 0.96),
         borderPadding=4,
         spaceBefore=2,
         spaceAfter=2,
     )
 
-    elements = [Spacer(1, 6 * mm)]
-    elements.append(Paragraph("Interpretation Notes", heading_style))
-    elements.append(Spacer(1, 2 * mm))
+    elements = [_RL.Spacer(1, 6 * _RL.mm)]
+    elements.append(_RL.Paragraph("Interpretation Notes", heading_style))
+    elements.append(_RL.Spacer(1, 2 * _RL.mm))
     for w in warnings:
-        elements.append(Paragraph(f"\u2022 {w}", warn_style))
-    elements.append(Spacer(1, 6 * mm))
+        elements.append(_RL.Paragraph(f"\u2022 {w}", warn_style))
+    elements.append(_RL.Spacer(1, 6 * _RL.mm))
 
     return elements
 
 
-def _build_iso19157_table(styles) -> Table:
+def _build_iso19157_table(styles) -> "Table":
     """Build ISO 19157 quality element mapping table."""
     data = [
         ["GeoAccuRate Metric", "ISO 19157 Quality Element", "Measure"],
@@ -539,10 +711,10 @@ def _build_iso19157_table(styles) -> Table:
          "Missing item"],
     ]
 
-    table = Table(data, colWidths=[5 * cm, 6 * cm, 5 * cm])
-    table.setStyle(TableStyle([
-        ("BACKGROUND", (0, 0), (-1, 0), colors.Color(0.8, 0.8, 0.8)),
-        ("GRID", (0, 0), (-1, -1), 0.5, colors.black),
+    table = _RL.Table(data, colWidths=[5 * _RL.cm, 6 * _RL.cm, 5 * _RL.cm])
+    table.setStyle(_RL.TableStyle([
+        ("BACKGROUND", (0, 0), (-1, 0), _RL.colors.Color(0.8, 0.8, 0.8)),
+        ("GRID", (0, 0), (-1, -1), 0.5, _RL.colors.black),
         ("FONTSIZE", (0, 0), (-1, -1), 7),
         ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
         ("VALIGN", (0, 0), (-1, -1), "TOP"),
@@ -586,5 +758,29 @@ def _save_provenance_json(
     if result.kappa is not None:
         prov["results"]["kappa"] = result.kappa
 
-    with open(output_path, "w") as f:
-        json.dump(prov, f, indent=2)
+    if _HAS_ORJSON:
+        with open(output_path, "wb") as f:
+            f.write(orjson.dumps(
+                prov,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                | orjson.OPT_NON_STR_KEYS,
+            ))
+    else:
+        # Match orjson's output: UTF-8 text, NaN/inf as null, numpy as lists
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(_json_safe(prov), f, indent=2, ensure_ascii=False)
+
+
+def _json_safe(obj):
+    """Convert numpy values and non-finite floats the way orjson does."""
+    if isinstance(obj, dict):
+        return {k: _json_safe(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_json_safe(v) for v in obj]
+    if isinstance(obj, np.ndarray):
+        return _json_safe(obj.tolist())
+    if isinstance(obj, np.generic):
+        obj = obj.item()
+    if isinstance(obj, float) and not math.isfinite(obj):
+        return None
+    return obj
@@ -5,7 +5,8 @@ Wraps the accuracy workflow in a QgsTask for non-blocking execution.
 Depends on: qgis.core, core.accuracy_workflow.
 """
 
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional
 
 import numpy as np
 
@@ -23,19 +24,28 @@ class AccuracyTask(QgsTask):
         task = AccuracyTask(config)
         task.completed.connect(on_done)   # custom signal
         QgsApplication.taskManager().addTask(task)
+
+    Array inputs are copied. The class_names and class_mapping dicts are
+    wrapped in read-only views instead of copied: callers keep ownership
+    but must not mutate them after the task is submitted.
     """
 
     def __init__(self, config: dict):
         super().__init__("Computing accuracy metrics", QgsTask.CanCancel)
 
-        # COPY all data before task starts — never reference GUI objects
+        # COPY arrays before task starts — never reference GUI objects
         self.config = dict(config)
         self._classified_raster_path: str = config["classified_raster_path"]
         self._reference_points_xy: np.ndarray = config["reference_points_xy"].copy()
         self._reference_class_values: np.ndarray = config["reference_class_values"].copy()
         self._class_labels: tuple = tuple(config["class_labels"])
-        self._class_names: dict = dict(config.get("class_names", {}))
-        self._class_mapping: Optional[dict] = config.get("class_mapping")
+        self._class_names: Mapping[int, str] = MappingProxyType(
+            config.get("class_names") or {}
+        )
+        class_mapping = config.get("class_mapping")
+        self._class_mapping: Optional[Mapping[int, int]] = (
+            MappingProxyType(class_mapping) if class_mapping is not None else None
+        )
         self._compute_kappa: bool = config.get("compute_kappa", False)
         self._compute_area_weighted: bool = config.get("compute_area_weighted", True)
         self._confidence_level: float = config.get("confidence_level", 0.95)
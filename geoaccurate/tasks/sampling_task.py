@@ -3,7 +3,8 @@
 Wraps the sampling workflow in a QgsTask for non-blocking execution.
 """
 
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 
 from qgis.core import Qgis, QgsMessageLog, QgsTask
 
@@ -26,25 +27,38 @@ class SamplingTask(QgsTask):
         self._seed: int = config.get("seed", 42)
         self._min_per_class: int = config.get("min_per_class", 25)
         self._total_n_override: int = config.get("total_n_override", 0)
-        self._class_names: dict = dict(config.get("class_names", {}))
+        # Read-only view, not a copy (see AccuracyTask)
+        self._class_names: Mapping[int, str] = MappingProxyType(
+            config.get("class_names") or {}
+        )
         self._allocation_override: Optional[Dict[int, int]] = config.get(
             "allocation_override"
         )
 
         self.result: Optional[SampleSet] = None
         self.exception: Optional[Exception] = None
+        # Last whole percentage forwarded to setProgress (throttling)
+        self._last_pct: int = -1
+        # Messages logged from run(); flushed on the main thread in finished()
+        self._log_buf: List[Tuple[str, int]] = []
+
+    def _log(self, message: str, level: int = Qgis.Info):
+        """Queue a log message instead of logging from the worker thread."""
+        self._log_buf.append((message, level))
 
     def run(self) -> bool:
         try:
-            QgsMessageLog.logMessage(
-                "Starting sample generation...",
-                "GeoAccuRate", Qgis.Info,
-            )
+            self._log("Starting sample generation...")
 
             def progress(step, total):
                 if self.isCanceled():
                     raise InterruptedError("Task cancelled")
-                self.setProgress(step / total * 100)
+                # Only emit on whole-percent changes; the workflow may
+                # report every sample and each setProgress is a Qt signal.
+                pct = int(step / total * 100) if total else 100
+                if pct != self._last_pct:
+                    self._last_pct = pct
+                    self.setProgress(pct)
 
             self.result = run_sample_generation(
                 raster_path=self._raster_path,
@@ -61,22 +75,20 @@ class SamplingTask(QgsTask):
                 allocation_override=self._allocation_override,
             )
 
-            QgsMessageLog.logMessage(
-                f"Generated {len(self.result.points)} sample points",
-                "GeoAccuRate", Qgis.Info,
-            )
+            self._log(f"Generated {len(self.result)} sample points")
             return True
 
         except InterruptedError:
             return False
         except Exception as e:
             self.exception = e
-            QgsMessageLog.logMessage(
-                f"Sampling failed: {e}", "GeoAccuRate", Qgis.Critical,
-            )
+            self._log(f"Sampling failed: {e}", Qgis.Critical)
             return False
 
     def finished(self, success: bool):
+        for message, level in self._log_buf:
+            QgsMessageLog.logMessage(message, "GeoAccuRate", level)
+        self._log_buf.clear()
         if self.exception:
             QgsMessageLog.logMessage(
                 f"Error: {self.exception}", "GeoAccuRate", Qgis.Critical,
@@ -0,0 +1,101 @@
+"""Fixtures for domain-layer tests.
+
+Only numpy and the golden JSON files are used here, nothing Qt/QGIS,
+so this suite can run in parallel workers (``pytest -m domain -n auto``).
+"""
+
+import json
+import os
+import types
+
+import numpy as np
+import pytest
+
+GOLDEN_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "golden"
+)
+
+
+@pytest.fixture(scope="session")
+def olofsson_golden():
+    """Load Olofsson et al. 2014 Table 4 golden test data.
+
+    Loaded once per session and returned as a read-only mapping with a
+    read-only matrix, so a test that mutates shared data fails loudly
+    instead of affecting later tests. class_labels is a tuple, so the
+    same object is passed to every test.
+    """
+    path = os.path.join(GOLDEN_DIR, "olofsson_table4.json")
+    with open(path) as f:
+        data = json.load(f)
+    data["matrix"] = np.array(data["matrix"], dtype=np.int64)
+    data["matrix"].setflags(write=False)
+    data["class_labels"] = tuple(data["class_labels"])
+    # Convert string keys to int for mapped_area_ha
+    data["mapped_area_ha"] = types.MappingProxyType({
+        int(k): v for k, v in data["mapped_area_ha"].items()
+    })
+    return types.MappingProxyType(data)
+
+
+@pytest.fixture(scope="session")
+def pontius_golden():
+    """Load Pontius & Millones 2011 golden test data.
+
+    Loaded once per session; like olofsson_golden, the data and each
+    test case are read-only mappings with read-only matrices.
+    """
+    path = os.path.join(GOLDEN_DIR, "pontius_example.json")
+    with open(path) as f:
+        data = json.load(f)
+    cases = []
+    for case in data["test_cases"]:
+        case["matrix"] = np.asarray(case["matrix"], dtype=np.int64)
+        case["matrix"].setflags(write=False)
+        cases.append(types.MappingProxyType(case))
+    data["test_cases"] = tuple(cases)
+    return types.MappingProxyType(data)
+
+
+# Shared read-only matrices: allocated once, writes raise ValueError.
+# Reference=rows, Classified=cols.
+
+# 80% overall accuracy
+#          Classified
+#            C0   C1
+# Ref  R0 [ 40,  10 ]
+#      R1 [ 10,  40 ]
+_SIMPLE_2CLASS = np.array([[40, 10], [10, 40]], dtype=np.int64)
+
+_PERFECT_3CLASS = np.array(
+    [[50, 0, 0], [0, 30, 0], [0, 0, 20]], dtype=np.int64
+)
+
+_ASYMMETRIC_5CLASS = np.array([
+    [45,  3,  1,  0,  1],   # Forest: PA = 90%
+    [ 2, 28,  4,  1,  0],   # Urban: PA = 80%
+    [ 1,  2, 15,  1,  1],   # Water: PA = 75%
+    [ 3,  1,  2, 38,  1],   # Crop: PA = 84%
+    [ 0,  1,  0,  2, 12],   # Bare: PA = 80%
+], dtype=np.int64)
+
+for _arr in (_SIMPLE_2CLASS, _PERFECT_3CLASS, _ASYMMETRIC_5CLASS):
+    _arr.setflags(write=False)
+
+
+@pytest.fixture(scope="session")
+def simple_2class_matrix():
+    """Simple 2-class confusion matrix for basic tests."""
+    return _SIMPLE_2CLASS
+
+
+@pytest.fixture(scope="session")
+def perfect_matrix():
+    """Perfect 3-class confusion matrix (100% accuracy)."""
+    return _PERFECT_3CLASS
+
+
+@pytest.fixture(scope="session")
+def asymmetric_5class_matrix():
+    """Realistic 5-class matrix with varied accuracy."""
+    return _ASYMMETRIC_5CLASS
@@ -0,0 +1,62 @@
+"""Micro-benchmarks for the domain hot paths (requires pytest-benchmark).
+
+Deselected by default and skipped when the pytest-benchmark plugin is
+not installed. Run them with ``-m benchmark``; to catch regressions,
+save a baseline and compare against it, e.g.:
+
+    pytest geoaccurate/test -m benchmark --benchmark-autosave
+    pytest geoaccurate/test -m benchmark \
+        --benchmark-compare --benchmark-compare-fail=mean:10%
+"""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from geoaccurate.domain import olofsson, pontius
+from geoaccurate.domain.confusion_matrix import (
+    build_matrix,
+    compute_metrics,
+)
+from geoaccurate.domain.sampling import generate_stratified_random
+
+pytestmark = [pytest.mark.domain, pytest.mark.benchmark]
+
+
+def test_pontius_compute_bench(benchmark, asymmetric_5class_matrix):
+    qd, ad = benchmark(pontius.compute, asymmetric_5class_matrix)
+    assert qd >= 0 and ad >= 0
+
+
+def test_compute_metrics_bench(benchmark, asymmetric_5class_matrix):
+    result = benchmark(compute_metrics, asymmetric_5class_matrix, (0, 1, 2, 3, 4))
+    assert 0.0 <= result["overall_accuracy"] <= 1.0
+
+
+def test_olofsson_compute_bench(benchmark, olofsson_golden):
+    result = benchmark(
+        olofsson.compute,
+        olofsson_golden["matrix"],
+        olofsson_golden["mapped_area_ha"],
+        olofsson_golden["class_labels"],
+    )
+    assert 0.0 <= result.overall_accuracy_weighted <= 1.0
+
+
+def test_build_matrix_bench(benchmark):
+    rng = np.random.default_rng(0)
+    classified = rng.integers(0, 6, 100_000)
+    reference = rng.integers(0, 6, 100_000)
+    matrix = benchmark(build_matrix, classified, reference, tuple(range(5)))
+    assert matrix.shape == (5, 5)
+
+
+def test_generate_stratified_random_bench(benchmark):
+    xs, ys = np.mgrid[0:1000:10, 0:1000:10]
+    candidates = {1: np.column_stack([xs.ravel(), ys.ravel()]).astype(float)}
+    points, _ = benchmark(
+        generate_stratified_random, candidates, {1: 50},
+        min_distance=15.0, seed=42,
+    )
+    assert len(points) == 50
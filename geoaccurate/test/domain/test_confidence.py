@@ -1,13 +1,18 @@
 """Tests for confidence interval methods."""
 
-
+import numpy as np
+import pytest
 
 from geoaccurate.domain.confidence import (
+    Z_SCORES,
     kappa_ci,
     wilson_ci,
+    wilson_ci_vec,
     z_score_for_confidence,
 )
 
+pytestmark = pytest.mark.domain
+
 
 class TestWilsonCI:
     """Test Wilson score confidence interval."""
@@ -72,6 +77,18 @@ class TestWilsonCI:
         center = (lo + hi) / 2
         assert abs(center - 0.5) < 0.01
 
+    def test_vectorized_known_bounds(self):
+        """95% Wilson bounds against hand-computed values, incl. n == 0."""
+        p = np.array([0.0, 0.5, 0.8, 1.0, 0.3])
+        n = np.array([100, 1, 20, 50, 0])
+        lo, hi = wilson_ci_vec(p, n, z=1.96)
+        np.testing.assert_allclose(
+            lo, [0.0, 0.0546, 0.5840, 0.9286, 0.0], rtol=0, atol=1e-4
+        )
+        np.testing.assert_allclose(
+            hi, [0.0370, 0.9454, 0.9193, 1.0, 1.0], rtol=0, atol=1e-4
+        )
+
 
 class TestKappaCI:
     """Test Kappa confidence interval."""
@@ -104,6 +121,11 @@ class TestZScore:
         assert abs(z_score_for_confidence(0.90) - 1.6449) < 0.001
 
     def test_arbitrary_level(self):
-        """Non-standard confidence level should return reasonable z."""
-        z = z_score_for_confidence(0.975)
-        assert 2.0 < z < 2.5  # between 95% and 99%
+        """Untabulated level uses the Abramowitz & Stegun approximation."""
+        assert 0.97 not in Z_SCORES
+        z = z_score_for_confidence(0.97)
+        assert abs(z - 2.1701) < 1e-3  # exact: 2.17009
+
+    def test_float_noise_hits_table(self):
+        """Levels that differ only by float noise use the tabulated value."""
+        assert z_score_for_confidence(0.95 + 1e-12) == 1.96
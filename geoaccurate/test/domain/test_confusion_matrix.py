@@ -7,6 +7,8 @@ import pytest
 
 from geoaccurate.domain.confusion_matrix import build_matrix, compute_metrics
 
+pytestmark = pytest.mark.domain
+
 
 class TestBuildMatrix:
     """Tests for confusion matrix construction."""
@@ -55,6 +57,10 @@ class TestBuildMatrix:
         with pytest.raises(ValueError, match="mismatch"):
             build_matrix(np.array([0, 1]), np.array([0]), (0, 1))
 
+    def test_no_labels_gives_empty_matrix(self):
+        matrix = build_matrix(np.array([1, 2]), np.array([1, 2]), ())
+        assert matrix.shape == (0, 0)
+
     def test_single_class(self):
         classified = np.array([5, 5, 5])
         reference  = np.array([5, 5, 5])
@@ -71,9 +77,47 @@ class TestBuildMatrix:
         expected = np.array([[2, 0], [1, 0]], dtype=np.int64)
         np.testing.assert_array_equal(matrix, expected)
 
+    def test_non_contiguous_labels(self):
+        """Sparse class values (e.g. 10, 20, 255) map to matrix rows in order."""
+        classified = np.array([10, 255, 20, 20, -1, 300])
+        reference  = np.array([10, 255, 255, 20, 10, 20])
+        labels = (10, 20, 255)
+        matrix = build_matrix(classified, reference, labels)
+        # -1 and 300 are not class labels, so those samples are skipped
+        expected = np.array([[1, 0, 0], [0, 1, 0], [0, 1, 1]], dtype=np.int64)
+        np.testing.assert_array_equal(matrix, expected)
+
+    def test_float_values_match_integer_values(self):
+        """Float-typed inputs (fallback path) give the same matrix."""
+        classified = np.array([0, 1, 2, 1, 99])
+        reference  = np.array([0, 1, 1, 2, 0])
+        labels = (0, 1, 2)
+        np.testing.assert_array_equal(
+            build_matrix(classified.astype(float), reference.astype(float), labels),
+            build_matrix(classified, reference, labels),
+        )
+
+    def test_labels_outside_lookup_range(self):
+        """Negative or very large class values use the fallback path."""
+        classified = np.array([-1, 70000, 70000, 5])
+        reference  = np.array([-1, 70000, -1, 5])
+        labels = (-1, 70000)
+        matrix = build_matrix(classified, reference, labels)
+        expected = np.array([[1, 1], [0, 1]], dtype=np.int64)
+        np.testing.assert_array_equal(matrix, expected)
+
+    def test_mixed_type_labels(self):
+        """Object arrays mixing int and str labels use the per-value fallback."""
+        classified = np.array([1, "water", "water", 2], dtype=object)
+        reference  = np.array([1, "water", 1, "x"], dtype=object)
+        labels = (1, "water")
+        matrix = build_matrix(classified, reference, labels)
+        expected = np.array([[1, 1], [0, 1]], dtype=np.int64)
+        np.testing.assert_array_equal(matrix, expected)
+
     def test_large_class_count(self):
         """10-class matrix smoke test."""
-        rng = np.random.RandomState(42)
+        rng = np.random.default_rng(42)
         n = 500
         labels = tuple(range(10))
         classified = rng.choice(labels, n)
@@ -82,6 +126,18 @@ class TestBuildMatrix:
         assert matrix.shape == (10, 10)
         assert matrix.sum() == n
 
+    @pytest.mark.parametrize("k", [3, 15, 16, 20])
+    def test_small_and_large_k_paths_agree(self, k):
+        """uint8 (k <= 15) and intp index paths match the dict fallback."""
+        rng = np.random.default_rng(7)
+        labels = tuple(range(0, 2 * k, 2))
+        classified = rng.integers(-1, 2 * k + 1, 400)
+        reference = rng.integers(-1, 2 * k + 1, 400)
+        np.testing.assert_array_equal(
+            build_matrix(classified, reference, labels),
+            build_matrix(classified.astype(float), reference.astype(float), labels),
+        )
+
 
 class TestComputeMetrics:
     """Tests for OA, PA, UA, F1, precision, recall."""
@@ -149,6 +205,13 @@ class TestComputeMetrics:
         assert result["users_accuracy"][0] == 30 / 30
         assert result["users_accuracy"][1] == 0 / 20
 
+    def test_float_matrix_not_truncated(self):
+        """Non-integral (e.g. weighted) counts are used as given."""
+        matrix = np.array([[1.5, 0.5], [0.5, 1.5]])
+        result = compute_metrics(matrix, (0, 1))
+        assert abs(result["overall_accuracy"] - 0.75) < 1e-10
+        assert abs(result["producers_accuracy"][0] - 0.75) < 1e-10
+
     def test_matrix_shape_mismatch_raises(self):
         matrix = np.array([[10, 5], [5, 10]], dtype=np.int64)
         with pytest.raises(ValueError, match="shape"):
@@ -5,6 +5,8 @@ import pytest
 
 from geoaccurate.domain.kappa import compute
 
+pytestmark = pytest.mark.domain
+
 
 class TestKappa:
     """Test Cohen's Kappa computation."""
@@ -33,8 +35,8 @@ class TestKappa:
 
     def test_random_agreement_kappa_near_zero(self):
         """Random predictions → Kappa near 0."""
-        rng = np.random.RandomState(42)
-        matrix = rng.randint(10, 50, size=(3, 3)).astype(np.int64)
+        rng = np.random.default_rng(42)
+        matrix = rng.integers(10, 50, size=(3, 3), dtype=np.int64)
         # Force equal row/col totals roughly
         kappa, ci = compute(matrix)
         # Random agreement → Kappa should be small (positive or negative)
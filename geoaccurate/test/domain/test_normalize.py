@@ -5,6 +5,8 @@ import pytest
 
 from domain.confusion_matrix import normalize_confusion_matrix
 
+pytestmark = pytest.mark.domain
+
 
 class TestNormalizeConfusionMatrix:
     """Tests for row/column normalization of confusion matrices."""
@@ -62,3 +64,10 @@ class TestNormalizeConfusionMatrix:
         np.testing.assert_allclose(norm, np.zeros((3, 3)))
         assert not np.any(np.isnan(norm))
         assert not np.any(np.isinf(norm))
+
+    def test_zero_column_column_normalize(self):
+        """Zero-sum columns are skipped without divide-by-zero warnings."""
+        matrix = np.array([[10, 0], [30, 0]], dtype=np.int64)
+        with np.errstate(all="raise"):
+            norm = normalize_confusion_matrix(matrix, axis=0)
+        np.testing.assert_allclose(norm, [[25.0, 0.0], [75.0, 0.0]])
@@ -7,6 +7,8 @@ import pytest
 
 from geoaccurate.domain.olofsson import compute
 
+pytestmark = pytest.mark.domain
+
 
 class TestOlofsson:
     """Test Olofsson area-weighted estimation."""
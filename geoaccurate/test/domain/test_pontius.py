@@ -0,0 +1,119 @@
+"""Tests for Pontius & Millones (2011) Quantity/Allocation Disagreement."""
+
+import numpy as np
+import pytest
+
+from geoaccurate.domain.pontius import compute
+
+pytestmark = pytest.mark.domain
+
+# Shared read-only input matrices
+# Symmetric errors: each class has the same row and column total
+_SYM_ERRORS = np.array([
+    [40, 5, 5],
+    [5, 40, 5],
+    [5, 5, 40],
+], dtype=np.int64)
+_EMPTY_3X3 = np.zeros((3, 3), dtype=np.int64)
+_SINGLE_CLASS = np.array([[100]], dtype=np.int64)
+for _m in (_SYM_ERRORS, _EMPTY_3X3, _SINGLE_CLASS):
+    _m.setflags(write=False)
+
+
+def _random_batch(rng, n, k_max, high):
+    """n non-empty random k x k matrices (2 <= k <= k_max).
+
+    Draws all values in one (n, k_max, k_max) call and slices each
+    matrix out as a contiguous copy.
+    """
+    ks = rng.integers(2, k_max + 1, size=n)
+    buf = rng.integers(0, high, size=(n, k_max, k_max), dtype=np.int64)
+    matrices = [np.ascontiguousarray(buf[i, :k, :k]) for i, k in enumerate(ks)]
+    return [m for m in matrices if m.any()]
+
+
+@pytest.fixture(scope="module", params=range(5), ids=lambda s: f"seed{s}")
+def random_matrices(request):
+    """Batch of 30 random matrices per seed, shared by the property tests."""
+    rng = np.random.default_rng(request.param)
+    matrices = tuple(_random_batch(rng, n=30, k_max=9, high=100))
+    for m in matrices:
+        m.setflags(write=False)
+    return matrices
+
+
+class TestPontiusMetrics:
+    """Test Pontius Quantity and Allocation Disagreement."""
+
+    def test_perfect_agreement(self, perfect_matrix):
+        """Perfect agreement → QD=0, AD=0."""
+        qd, ad = compute(perfect_matrix)
+        np.testing.assert_allclose([qd, ad], 0.0, rtol=0, atol=1e-10)
+
+    def test_identity_2class(self, simple_2class_matrix):
+        """QD + AD must equal 1 - OA."""
+        qd, ad = compute(simple_2class_matrix)
+        N = simple_2class_matrix.sum()
+        oa = simple_2class_matrix.diagonal().sum() / N
+        np.testing.assert_allclose(qd + ad, 1.0 - oa, rtol=0, atol=1e-10)
+
+    def test_identity_5class(self, asymmetric_5class_matrix):
+        """QD + AD must equal 1 - OA for 5-class matrix."""
+        qd, ad = compute(asymmetric_5class_matrix)
+        N = asymmetric_5class_matrix.sum()
+        oa = asymmetric_5class_matrix.diagonal().sum() / N
+        np.testing.assert_allclose(qd + ad, 1.0 - oa, rtol=0, atol=1e-10)
+
+    def test_symmetric_errors_no_quantity(self):
+        """Symmetric off-diagonal errors → QD = 0, only AD."""
+        qd, ad = compute(_SYM_ERRORS)
+        # Row totals = col totals = [50, 50, 50] → no quantity difference
+        np.testing.assert_allclose(qd, 0.0, rtol=0, atol=1e-10)
+        assert ad > 0  # allocation errors exist
+
+    def test_golden_3class(self, pontius_golden):
+        """Verify against golden test data."""
+        case = pontius_golden["test_cases"][2]  # three_class_example
+        matrix = case["matrix"]
+        qd, ad = compute(matrix)
+
+        oa = matrix.diagonal().sum() / matrix.sum()
+        expected_oa = case["expected_oa"]
+        np.testing.assert_allclose(
+            oa, expected_oa, rtol=0, atol=pontius_golden["tolerance"]
+        )
+
+        # QD + AD must equal 1 - OA
+        np.testing.assert_allclose(qd + ad, 1.0 - oa, rtol=0, atol=1e-10)
+
+    def test_golden_perfect(self, pontius_golden):
+        """Perfect agreement golden case."""
+        case = pontius_golden["test_cases"][0]  # perfect_agreement
+        matrix = case["matrix"]
+        qd, ad = compute(matrix)
+        np.testing.assert_allclose(
+            [qd, ad], [case["expected_qd"], case["expected_ad"]],
+            rtol=0, atol=1e-10,
+        )
+
+    def test_qd_and_ad_non_negative(self, random_matrices):
+        """QD and AD must always be >= 0."""
+        matrices = random_matrices
+        qd_ad = np.array([compute(m) for m in matrices])
+        assert (qd_ad >= -1e-10).all(), f"negative QD/AD: {qd_ad.min()}"
+
+    def test_identity_holds_random_matrices(self, random_matrices):
+        """Identity QD + AD = 1 - OA must hold for random matrices."""
+        matrices = random_matrices
+        oa = np.array([m.trace() / m.sum() for m in matrices])
+        qd_ad = np.array([compute(m) for m in matrices])
+        np.testing.assert_allclose(qd_ad.sum(axis=1), 1.0 - oa, rtol=0, atol=1e-9)
+
+    def test_empty_matrix_raises(self):
+        with pytest.raises(ValueError, match="empty"):
+            compute(_EMPTY_3X3)
+
+    def test_single_class(self):
+        """Single class → QD=0, AD=0."""
+        qd, ad = compute(_SINGLE_CLASS)
+        np.testing.assert_allclose([qd, ad], 0.0, rtol=0, atol=1e-10)
@@ -1,8 +1,11 @@
 """Tests for sample size calculation, allocation, and point generation."""
 
+from operator import attrgetter
+
 import numpy as np
 import pytest
 
+from geoaccurate.domain.models import SampleSet
 from geoaccurate.domain.sample_size import (
     allocate_equal,
     allocate_proportional,
@@ -10,6 +13,75 @@ from geoaccurate.domain.sample_size import (
 )
 from geoaccurate.domain.sampling import generate_stratified_random
 
+# Try to import scipy for the nearest-neighbour check
+try:
+    from scipy.spatial import cKDTree
+
+    _HAS_SCIPY = True
+except ImportError:
+    _HAS_SCIPY = False
+
+pytestmark = pytest.mark.domain
+
+_get_xy = attrgetter("x", "y")
+
+
+def _coords(points):
+    """(N, 2) array of point coordinates, filled in one pre-sized pass."""
+    return np.fromiter(
+        (v for p in points for v in _get_xy(p)),
+        dtype=float, count=2 * len(points),
+    ).reshape(-1, 2)
+
+
+def _nearest_neighbours(coords):
+    """Distance to, and index of, each point's nearest other point.
+
+    Uses a cKDTree (O(N log N)) when scipy is available, otherwise a
+    dense pairwise distance matrix.
+    """
+    if _HAS_SCIPY:
+        dist, idx = cKDTree(coords).query(coords, k=2)
+        return dist[:, 1], idx[:, 1]
+    diff = coords[:, None, :] - coords[None, :, :]
+    dist = np.sqrt(np.einsum("ijk,ijk->ij", diff, diff))
+    np.fill_diagonal(dist, np.inf)
+    idx = dist.argmin(axis=1)
+    return dist[np.arange(len(coords)), idx], idx
+
+
+def _readonly(arr):
+    """Float copy of arr with writes disabled."""
+    arr = arr.astype(float)
+    arr.setflags(write=False)
+    return arr
+
+
+def _two_lines(n):
+    """Candidates for classes 1 and 2 on two parallel lines, n points each."""
+    line = np.column_stack([np.arange(n), np.zeros(n)])
+    return {1: _readonly(line), 2: _readonly(line + [0, n])}
+
+
+@pytest.fixture(scope="class")
+def candidates_grids(request):
+    """Attach shared read-only candidate sets to the test class.
+
+    Built once per class instead of once per test method:
+        candidates_50: {1: 50 x 50 unit-spaced grid}
+        candidates_100: {1: 100 x 100 grid, 10 units apart}
+        lines_50 / lines_100: two classes on parallel lines of n points
+    """
+    xs, ys = np.mgrid[0:1000:10, 0:1000:10]
+    request.cls.candidates_50 = {
+        1: _readonly(np.mgrid[0:50, 0:50].reshape(2, -1).T)
+    }
+    request.cls.candidates_100 = {
+        1: _readonly(np.column_stack([xs.ravel(), ys.ravel()]))
+    }
+    request.cls.lines_50 = _two_lines(50)
+    request.cls.lines_100 = _two_lines(100)
+
 
 class TestSampleSize:
     """Test sample size calculator."""
@@ -99,30 +171,27 @@ class TestAllocation:
             allocate_proportional(100, {})
 
 
+@pytest.mark.usefixtures("candidates_grids")
 class TestStratifiedRandomSampling:
     """Test stratified random point generation."""
 
     def test_correct_count(self):
         """Generates correct number of points per class."""
-        candidates = {
-            1: np.array([[i, 0] for i in range(100)], dtype=float),
-            2: np.array([[i, 100] for i in range(100)], dtype=float),
-        }
+        candidates = self.lines_100
         n_per_class = {1: 20, 2: 30}
         points, warnings = generate_stratified_random(
             candidates, n_per_class, seed=42
         )
-        class_counts = {}
-        for p in points:
-            class_counts[p.stratum_class] = class_counts.get(p.stratum_class, 0) + 1
-        assert class_counts[1] == 20
-        assert class_counts[2] == 30
+        strata = np.fromiter(
+            (p.stratum_class for p in points), dtype=np.int64, count=len(points)
+        )
+        counts = np.bincount(strata)
+        assert counts[1] == 20
+        assert counts[2] == 30
 
     def test_reproducibility(self):
         """Same seed → same points."""
-        candidates = {
-            1: np.array([[i, j] for i in range(50) for j in range(50)], dtype=float),
-        }
+        candidates = self.candidates_50
         n_per_class = {1: 25}
 
         points_a, _ = generate_stratified_random(candidates, n_per_class, seed=42)
@@ -133,42 +202,39 @@ class TestStratifiedRandomSampling:
             assert a.y == b.y
 
     def test_different_seed_different_points(self):
-        candidates = {
-            1: np.array([[i, j] for i in range(50) for j in range(50)], dtype=float),
-        }
+        candidates = self.candidates_50
         n_per_class = {1: 25}
 
         points_a, _ = generate_stratified_random(candidates, n_per_class, seed=42)
         points_b, _ = generate_stratified_random(candidates, n_per_class, seed=99)
 
-        coords_a = {(p.x, p.y) for p in points_a}
-        coords_b = {(p.x, p.y) for p in points_b}
-        assert coords_a != coords_b
+        coords_a = _coords(points_a)
+        coords_b = _coords(points_b)
+        # Compare as point sets: sort rows by (x, y) before comparing
+        assert not np.array_equal(
+            coords_a[np.lexsort(coords_a.T[::-1])],
+            coords_b[np.lexsort(coords_b.T[::-1])],
+        )
 
     def test_min_distance_respected(self):
         """All points must be at least min_distance apart."""
-        candidates = {
-            1: np.array(
-                [[i * 10, j * 10] for i in range(100) for j in range(100)],
-                dtype=float,
-            ),
-        }
+        candidates = self.candidates_100
         n_per_class = {1: 50}
         min_dist = 15.0
 
-        points, _ = generate_stratified_random(
-            candidates, n_per_class, min_distance=min_dist, seed=42
+        points, coords, _ = generate_stratified_random(
+            candidates, n_per_class, min_distance=min_dist, seed=42,
+            return_arrays=True,
+        )
+        np.testing.assert_array_equal(coords, _coords(points))
+
+        # Nearest-neighbour distance of every point must respect min_dist
+        nn_dist, nn_idx = _nearest_neighbours(coords)
+        worst = int(np.argmin(nn_dist))
+        assert nn_dist[worst] >= min_dist - 1e-6, (
+            f"Points {worst} and {nn_idx[worst]} are "
+            f"{nn_dist[worst]:.2f} apart (min_distance={min_dist})"
         )
-
-        # Check all pairwise distances
-        coords = np.array([[p.x, p.y] for p in points])
-        for i in range(len(coords)):
-            for j in range(i + 1, len(coords)):
-                dist = np.sqrt(np.sum((coords[i] - coords[j]) ** 2))
-                assert dist >= min_dist - 1e-6, (
-                    f"Points {i} and {j} are {dist:.2f} apart "
-                    f"(min_distance={min_dist})"
-                )
 
     def test_insufficient_candidates_warning(self):
         """Warning when fewer candidates than requested samples."""
@@ -191,11 +257,43 @@ class TestStratifiedRandomSampling:
         assert len(warnings) > 0
 
     def test_point_ids_sequential(self):
-        candidates = {
-            1: np.array([[i, 0] for i in range(50)], dtype=float),
-            2: np.array([[i, 50] for i in range(50)], dtype=float),
-        }
+        candidates = self.lines_50
         n_per_class = {1: 10, 2: 10}
         points, _ = generate_stratified_random(candidates, n_per_class, seed=42)
-        ids = [p.id for p in points]
-        assert ids == list(range(1, 21))
+        ids = np.fromiter(
+            map(attrgetter("id"), points), dtype=np.int64, count=len(points)
+        )
+        np.testing.assert_array_equal(ids, np.arange(1, 21))
+
+
+@pytest.mark.usefixtures("candidates_grids")
+class TestSampleSet:
+    """Test the array-backed SampleSet container."""
+
+    def test_from_points_round_trip(self):
+        candidates = self.lines_50
+        points, _ = generate_stratified_random(
+            candidates, {1: 5, 2: 7}, seed=42
+        )
+        sample_set = SampleSet.from_points(
+            design=None, points=points, strata_info={}, warnings=(),
+        )
+        assert len(sample_set) == 12
+        assert sample_set.points == tuple(points)
+        np.testing.assert_array_equal(sample_set.xs, [p.x for p in points])
+        assert (sample_set.strata == 2).sum() == 7
+
+    def test_arrays_read_only_and_identity_eq(self):
+        points, _ = generate_stratified_random(
+            self.lines_50, {1: 5, 2: 7}, seed=42
+        )
+        sample_set = SampleSet.from_points(
+            design=None, points=points, strata_info={}, warnings=(),
+        )
+        with pytest.raises(ValueError):
+            sample_set.xs[0] = -1.0
+        assert sample_set == sample_set
+        assert sample_set != SampleSet.from_points(
+            design=None, points=points, strata_info={}, warnings=(),
+        )
+        hash(sample_set)
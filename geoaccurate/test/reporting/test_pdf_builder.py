@@ -0,0 +1,127 @@
+"""Tests for the pure-NumPy helpers in the PDF report builder."""
+
+import json
+import types
+
+import numpy as np
+import pytest
+
+from geoaccurate.domain.models import RunMetadata
+from geoaccurate.reporting import pdf_builder
+from geoaccurate.reporting.pdf_builder import _maybe_collapse_rare_classes
+
+
+def _names(k):
+    return [f"C{i}" for i in range(k)]
+
+
+class TestCollapseRareClasses:
+    """Test merging of rare classes into "Other" for display."""
+
+    def test_small_k_unchanged(self):
+        matrix = np.eye(15, dtype=np.int64)  # every class rare, but k <= 15
+        names = _names(15)
+        out, out_names, n = _maybe_collapse_rare_classes(matrix, names)
+        assert out is matrix
+        assert out_names is names
+        assert n == 0
+
+    def test_single_rare_class_not_merged(self):
+        matrix = np.eye(20, dtype=np.int64) * 50
+        matrix[7, 7] = 1
+        out, out_names, n = _maybe_collapse_rare_classes(matrix, _names(20))
+        assert out is matrix
+        assert n == 0
+
+    def test_all_rare_not_merged(self):
+        matrix = np.eye(20, dtype=np.int64)
+        out, out_names, n = _maybe_collapse_rare_classes(matrix, _names(20))
+        assert out is matrix
+        assert n == 0
+
+    def test_only_rare_classes_merged(self):
+        rng = np.random.default_rng(0)
+        matrix = rng.integers(0, 40, size=(20, 20))
+        rare = [3, 7, 9]
+        matrix[rare, :] = 0
+        matrix[:, rare] = 0
+        matrix[3, 3] = 1
+        matrix[7, 9] = 2
+        matrix[3, 0] = 1
+        matrix[5, 9] = 1
+        keep = [i for i in range(20) if i not in rare]
+
+        out, out_names, n = _maybe_collapse_rare_classes(matrix, _names(20))
+
+        assert n == 3
+        assert out.shape == (18, 18)
+        assert out_names == [f"C{i}" for i in keep] + ["Other"]
+        assert out.sum() == matrix.sum()
+        np.testing.assert_array_equal(out[:-1, :-1], matrix[np.ix_(keep, keep)])
+        np.testing.assert_array_equal(
+            out[:-1, -1], matrix[np.ix_(keep, rare)].sum(axis=1)
+        )
+        np.testing.assert_array_equal(
+            out[-1, :-1], matrix[np.ix_(rare, keep)].sum(axis=0)
+        )
+        assert out[-1, -1] == matrix[np.ix_(rare, rare)].sum() == 3
+
+    def test_well_sampled_classes_kept_for_large_k(self):
+        """No cap on kept classes: k=20 well-sampled classes stay as-is."""
+        matrix = np.full((20, 20), 20, dtype=np.int64)
+        matrix[[0, 1], :] = 0
+        matrix[:, [0, 1]] = 0
+        out, out_names, n = _maybe_collapse_rare_classes(matrix, _names(20))
+        assert n == 2
+        assert out.shape == (19, 19)
+        assert out_names[-1] == "Other"
+
+
+class TestProvenanceJson:
+    """The orjson and json.dump paths must write the same document."""
+
+    @staticmethod
+    def _write(tmp_path, monkeypatch, use_orjson):
+        monkeypatch.setattr(pdf_builder, "_HAS_ORJSON", use_orjson)
+        metadata = RunMetadata(
+            plugin_version="1.3.1",
+            qgis_version="3.34",
+            timestamp="2026-01-01T00:00:00Z",
+            classified_layer_path="/data/karte_\u00fcbersicht.tif",
+            classified_layer_name="Karte \u00dcbersicht",
+            reference_layer_path="/data/ref.gpkg",
+            reference_layer_name="R\u00e9f\u00e9rence",
+            reference_field="klasse",
+            crs_epsg=32633,
+            random_seed=None,
+            class_mapping={1: 1, 2: 3},
+            parameters={"confidence_level": np.float64(0.95),
+                        "n_classes": np.int64(2)},
+        )
+        result = types.SimpleNamespace(
+            n_samples=np.int64(100),
+            n_excluded_nodata=0,
+            overall_accuracy=0.8,
+            overall_accuracy_ci=(0.71, float("nan")),
+            quantity_disagreement=float("nan"),
+            allocation_disagreement=0.1,
+            kappa=None,
+        )
+        path = tmp_path / f"prov_{use_orjson}.json"
+        pdf_builder._save_provenance_json(metadata, result, str(path))
+        return json.loads(path.read_text(encoding="utf-8"))
+
+    def test_fallback_matches_orjson(self, tmp_path, monkeypatch):
+        pytest.importorskip("orjson")
+        via_orjson = self._write(tmp_path, monkeypatch, True)
+        via_json = self._write(tmp_path, monkeypatch, False)
+        assert via_json == via_orjson
+        assert via_json["results"]["quantity_disagreement"] is None
+        assert via_json["reference_layer"]["name"] == "R\u00e9f\u00e9rence"
+
+    def test_fallback_writes_utf8_and_null(self, tmp_path, monkeypatch):
+        prov = self._write(tmp_path, monkeypatch, False)
+        raw = (tmp_path / "prov_False.json").read_text(encoding="utf-8")
+        assert "R\u00e9f\u00e9rence" in raw
+        assert "NaN" not in raw
+        assert prov["results"]["overall_accuracy_ci"] == [0.71, None]